@@ -0,0 +1,130 @@
+"""
+Benchmark the solutions on their real inputs.
+
+Every day has a `benchmark_solution.py` next to its `test_solution.py`.
+The benchmarks are not collected by a plain `pytest` run, run them with
+
+    pytest -o python_files=benchmark_solution.py year2015 year2016
+
+Timings are compared against baselines stored as JSON (see `BASELINES_PATH`).
+A benchmark fails if it is slower than its baseline by more than
+`--benchmark-threshold` percent. Record new baselines with `--benchmark-save`.
+
+To see how a day scales, run it on synthetic inputs (see `aoc.generators`)
+of increasing size with
+
+    python -m aoc.benchmark <year> <day> <size> [<size> ...] [--seed <seed>]
+"""
+import argparse
+import importlib
+import inspect
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Final, Iterable, Optional
+
+from aoc.generators import write_input
+from aoc.result import Result
+
+ROOT: Final[Path] = Path(__file__).parent.parent
+BASELINES_PATH: Final[Path] = ROOT / "benchmarks.json"
+
+
+def time_function(function: Callable, *args, rounds: int = 3) -> tuple[Any, float]:
+    """Returns the function's result and its fastest run time in seconds."""
+
+    fastest = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = function(*args)
+        fastest = min(fastest, time.perf_counter() - start)
+
+    return result, fastest
+
+
+def compute_slowdown(seconds: float, baseline: float) -> float:
+    """Returns the slowdown in percent (negative for a speedup)."""
+
+    return (seconds - baseline) / baseline * 100
+
+
+def check_regression(
+    seconds: float, baseline: Optional[float], threshold: float
+) -> Optional[str]:
+    if not baseline:
+        return None
+
+    slowdown = compute_slowdown(seconds, baseline)
+    if slowdown <= threshold:
+        return None
+
+    return (
+        f"{seconds:.4f}s is {slowdown:.1f}% slower than the baseline of"
+        f" {baseline:.4f}s (threshold {threshold:.1f}%)."
+    )
+
+
+def load_baselines(path: Path = BASELINES_PATH) -> dict[str, float]:
+    if not Path(path).exists():
+        return {}
+
+    return json.loads(Path(path).read_text())
+
+
+def save_baselines(baselines: dict[str, float], path: Path = BASELINES_PATH):
+    Path(path).write_text(json.dumps(baselines, indent=4, sort_keys=True) + "\n")
+
+
+def measure_scaling(
+    year: int,
+    day: int,
+    sizes: Iterable[int],
+    directory: Path,
+    seed: int = 0,
+    **options,
+) -> list[tuple[int, Result]]:
+    """Run the day on a generated input of every size.
+
+    The generated input is passed for all input paths of the day's `run`.
+    """
+    module = importlib.import_module(f"year{year}.day{day:02}.solution")
+    n_input_paths = sum(
+        name.startswith("input_path")
+        for name in inspect.signature(module.run).parameters
+    )
+
+    curve = []
+    for size in sizes:
+        input_path = write_input(
+            Path(directory) / f"{size}.txt", year, day, size, seed, **options
+        )
+        curve.append((size, module.run(*[str(input_path)] * n_input_paths)))
+
+    return curve
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time a day on synthetic inputs of increasing size."
+    )
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("sizes", type=lambda size: int(float(size)), nargs="+")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        curve = measure_scaling(args.year, args.day, args.sizes, directory, args.seed)
+
+    print(f"{'size':>12}{'setup':>12}{'part1':>12}{'part2':>12}")
+    for size, result in curve:
+        timings = "".join(
+            f"{result.timings[name]:11.4f}s" if name in result.timings else f"{'-':>12}"
+            for name in ("setup", "part1", "part2")
+        )
+        print(f"{size:>12}{timings}")
+
+
+if __name__ == "__main__":
+    main()
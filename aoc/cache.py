@@ -0,0 +1,129 @@
+"""
+Cache the answers of the solutions on disk.
+
+Entries are content-addressed: they are keyed by the SHA-256 of a day's inputs
+(the file contents for input paths, the value itself for literal inputs
+like `"bgvyzdsv"`) and the SHA-256 of its `solution.py` and of the repository's
+modules it imports (e.g., `aoc.inputs`), directly or through other modules.
+Changing either the input or the solution invalidates the entry.
+"""
+import hashlib
+import inspect
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Final, Optional
+
+from aoc.result import Result
+
+ROOT: Final[Path] = Path(__file__).parent.parent
+
+
+def hash_input(value: Any) -> str:
+    if isinstance(value, str) and Path(value).is_file():
+        return hashlib.sha256(Path(value).read_bytes()).hexdigest()
+
+    return hashlib.sha256(repr(value).encode()).hexdigest()
+
+
+def hash_inputs(module: ModuleType, *args, **kwargs) -> str:
+    """Hash all arguments of the module's `run`, including the defaults."""
+
+    arguments = inspect.signature(module.run).bind(*args, **kwargs)
+    arguments.apply_defaults()
+    input_hashes = {
+        name: hash_input(value) for name, value in arguments.arguments.items()
+    }
+
+    return hashlib.sha256(json.dumps(input_hashes, sort_keys=True).encode()).hexdigest()
+
+
+def find_local_modules(module: ModuleType) -> dict[str, Path]:
+    """Paths of the module and of the modules under `ROOT` it imports, by name.
+
+    Imports are followed through the module's globals, both imported modules
+    and objects imported from modules (e.g., `from aoc.md5 import mine`).
+    """
+    modules: dict[str, Path] = {}
+    pending = [module]
+    while pending:
+        module = pending.pop()
+        path = Path(inspect.getfile(module))
+        if module.__name__ in modules or not path.is_relative_to(ROOT):
+            continue
+        modules[module.__name__] = path
+        for value in vars(module).values():
+            if not isinstance(value, ModuleType):
+                value = sys.modules.get(getattr(value, "__module__", None) or "")
+            if value is not None and getattr(value, "__file__", None):
+                pending.append(value)
+
+    return modules
+
+
+def hash_source(module: ModuleType) -> str:
+    source_hash = hashlib.sha256()
+    for name, path in sorted(find_local_modules(module).items()):
+        source_hash.update(name.encode())
+        source_hash.update(hashlib.sha256(path.read_bytes()).digest())
+
+    return source_hash.hexdigest()
+
+
+class AnswerCache:
+    def __init__(self, path: Path):
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " input_hash TEXT,"
+            " source_hash TEXT,"
+            " module TEXT,"
+            " answers TEXT,"
+            " timings TEXT,"
+            " PRIMARY KEY (input_hash, source_hash))"
+        )
+
+    def get(self, input_hash: str, source_hash: str) -> Optional[Result]:
+        row = self.connection.execute(
+            "SELECT answers, timings FROM answers"
+            " WHERE input_hash = ? AND source_hash = ?",
+            (input_hash, source_hash),
+        ).fetchone()
+        if row is None:
+            return None
+        part1, part2 = json.loads(row[0])
+
+        return Result(part1, part2, json.loads(row[1]))
+
+    def put(self, input_hash: str, source_hash: str, module: str, result: Result):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)",
+                (
+                    input_hash,
+                    source_hash,
+                    module,
+                    json.dumps([result.part1, result.part2]),
+                    json.dumps(result.timings),
+                ),
+            )
+
+    def run(self, module: ModuleType, *args, **kwargs) -> tuple[Result, bool]:
+        """Returns the module's result and whether it was served from the cache."""
+
+        input_hash = hash_inputs(module, *args, **kwargs)
+        source_hash = hash_source(module)
+
+        result = self.get(input_hash, source_hash)
+        if result is not None:
+            return result, True
+
+        result = module.run(*args, **kwargs)
+        self.put(input_hash, source_hash, module.__name__, result)
+
+        return result, False
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,60 @@
+"""
+Generate synthetic inputs of arbitrary size.
+
+Every generator takes the size of the input (e.g., the number of characters,
+lines, or cities, see the generator's docstring) and a seeded `random.Random`,
+and yields the input in chunks of bytes. Inputs are written to disk chunk by
+chunk, such that they never have to fit in memory. Write an input with
+
+    python -m aoc.generators <year> <day> <size> [--seed <seed>] [--output <path>]
+
+Days whose input is a literal (e.g., a secret key) or a hand-crafted program
+have no generator.
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import Callable, Final, Iterator
+
+from . import year2015, year2016
+
+GENERATORS: Final[dict[tuple[int, int], Callable[..., Iterator[bytes]]]] = {
+    **{(2015, day): generator for day, generator in year2015.GENERATORS.items()},
+    **{(2016, day): generator for day, generator in year2016.GENERATORS.items()},
+}
+
+
+def generate(
+    year: int, day: int, size: int, seed: int = 0, **options
+) -> Iterator[bytes]:
+    """The same seed always yields the same input."""
+
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"There's no generator for {year}/day{day:02}.")
+
+    return GENERATORS[(year, day)](size, random.Random(seed), **options)
+
+
+def write_input(
+    path: Path, year: int, day: int, size: int, seed: int = 0, **options
+) -> Path:
+    with Path(path).open("wb") as file:
+        for chunk in generate(year, day, size, seed, **options):
+            file.write(chunk)
+
+    return Path(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=lambda size: int(float(size)))  # allows 1e8
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    output = args.output or Path(f"input_{args.year}_{args.day:02}_{args.size}.txt")
+    write_input(output, args.year, args.day, args.size, args.seed)
+    print(f"Wrote {output} ({output.stat().st_size} bytes).")
@@ -0,0 +1,38 @@
+"""Building blocks shared by the generators of both years."""
+
+import random
+from itertools import islice
+from string import ascii_lowercase
+from typing import Callable, Final, Iterable, Iterator
+
+CHUNK_SIZE: Final[int] = 1 << 16
+BATCH_SIZE: Final[int] = 10_000
+
+
+def generate_stream(size: int, rng: random.Random, alphabet: bytes) -> Iterator[bytes]:
+    """`size` characters drawn uniformly from the alphabet.
+
+    Random bytes are translated to the alphabet, hence its length
+    must divide 256 for the draw to be uniform.
+    """
+    table = bytes(alphabet[i % len(alphabet)] for i in range(256))
+    for start in range(0, size, CHUNK_SIZE):
+        yield rng.randbytes(min(CHUNK_SIZE, size - start)).translate(table)
+
+
+def encode_lines(lines: Iterable[str]) -> Iterator[bytes]:
+    """Encode the lines in batches."""
+
+    lines = iter(lines)
+    while batch := list(islice(lines, BATCH_SIZE)):
+        yield ("\n".join(batch) + "\n").encode()
+
+
+def generate_lines(
+    size: int, rng: random.Random, generate_line: Callable[[random.Random], str]
+) -> Iterator[bytes]:
+    return encode_lines(generate_line(rng) for _ in range(size))
+
+
+def generate_word(rng: random.Random, min_length: int, max_length: int) -> str:
+    return "".join(rng.choices(ascii_lowercase, k=rng.randint(min_length, max_length)))
@@ -0,0 +1,79 @@
+import re
+import sys
+from itertools import accumulate
+
+import pytest
+from . import GENERATORS, generate, write_input
+from aoc.benchmark import measure_scaling
+from year2016.day04 import solution as year2016_day04
+
+# Sizes at which the solutions are still fast, some days have hard-coded limits
+# (e.g., 4 ingredients on day 15 or a 100x100 grid on day 18 of 2015).
+SIZES = {
+    (2015, 6): 20,
+    (2015, 9): 5,
+    (2015, 13): 5,
+    (2015, 15): 4,
+    (2015, 17): 10,
+    (2015, 18): 100,
+}
+
+
+@pytest.mark.parametrize("year, day", GENERATORS)
+def test_generate_is_reproducible(year: int, day: int):
+    size = SIZES.get((year, day), 50)
+
+    assert b"".join(generate(year, day, size, seed=1)) == b"".join(
+        generate(year, day, size, seed=1)
+    )
+    assert b"".join(generate(year, day, size, seed=1)) != b"".join(
+        generate(year, day, size, seed=2)
+    )
+
+
+@pytest.mark.parametrize("year, day", GENERATORS)
+def test_generated_input_is_valid(year: int, day: int, tmp_path):
+    if (year, day) == (2016, 3) and sys.version_info < (3, 12):
+        pytest.skip("The solution requires `itertools.batched`.")
+
+    [(_, result)] = measure_scaling(year, day, [SIZES.get((year, day), 50)], tmp_path)
+
+    assert result.timings.keys() & {"part1", "part2"}
+
+
+def test_generated_rooms_are_valid(tmp_path):
+    input_path = write_input(tmp_path / "input.txt", 2016, 4, 20_000)
+    lines = input_path.read_text().splitlines()
+    rooms = list(year2016_day04.parse_input(str(input_path)))
+
+    assert len(rooms) == len(lines) == 20_000
+    for line, (name, sector_id, checksum) in zip(lines, rooms):
+        assert re.fullmatch(r"[a-z]+(-[a-z]+)+-\d{3}\[[a-z]{5}\]", line)
+        assert line == f"{name}-{sector_id}[{checksum}]"
+
+
+@pytest.mark.parametrize("size", [0, 1, 1 << 16, (1 << 16) + 1])
+def test_generate_stream_size(size: int):
+    assert len(b"".join(generate(2015, 1, size))) == size
+
+
+@pytest.mark.parametrize("basement_position", [1, 17, 99_999])
+def test_generate_basement_position(basement_position: int):
+    directions = b"".join(
+        generate(2015, 1, 100_000, basement_position=basement_position)
+    )
+    floors = accumulate(1 if direction == ord("(") else -1 for direction in directions)
+
+    assert len(directions) == 100_000
+    assert (
+        next(i for i, floor in enumerate(floors, 1) if floor < 0) == basement_position
+    )
+
+
+def test_generate_lines_size():
+    assert b"".join(generate(2015, 2, 12_345)).count(b"\n") == 12_345
+
+
+def test_generate_missing_day():
+    with pytest.raises(KeyError):
+        generate(2015, 4, 10)
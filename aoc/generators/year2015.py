@@ -0,0 +1,272 @@
+"""Generators for the inputs of 2015."""
+import json
+import random
+from itertools import chain
+from string import ascii_lowercase, hexdigits
+from typing import Callable, Iterator, Optional, Union
+
+from .common import CHUNK_SIZE, encode_lines, generate_lines, generate_stream
+
+COLORS = ("red", "green", "blue", "orange", "yellow", "violet")
+AUNT_ATTRIBUTES = (
+    "children",
+    "cats",
+    "samoyeds",
+    "pomeranians",
+    "akitas",
+    "vizslas",
+    "goldfish",
+    "trees",
+    "cars",
+    "perfumes",
+)
+
+
+# Balanced blocks like "((()))" of up to 16 parentheses, indexed by a random byte.
+BALANCED_BLOCKS = [b"(" * (i % 8 + 1) + b")" * (i % 8 + 1) for i in range(256)]
+
+
+def _generate_balanced(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` (even) parentheses that never go below, and end on, floor 0."""
+
+    while size >= 16:
+        n_blocks = min(CHUNK_SIZE // 16, size // 16)
+        chunk = b"".join(map(BALANCED_BLOCKS.__getitem__, rng.randbytes(n_blocks)))
+        size -= len(chunk)
+        yield chunk
+
+    yield b"()" * (size // 2)
+
+
+def generate_day01(
+    size: int, rng: random.Random, basement_position: Optional[int] = None
+) -> Iterator[bytes]:
+    """`size` parentheses.
+
+    Santa first enters the basement at the (odd) `basement_position`.
+    Without it, the directions are a random walk that usually enters the basement
+    within the first few steps.
+    """
+    if basement_position is None:
+        return generate_stream(size, rng, b"()")
+    if not (basement_position % 2 and 0 < basement_position <= size):
+        raise ValueError(
+            f"Can't enter the basement at {basement_position} of {size} directions."
+        )
+
+    return chain(
+        _generate_balanced(basement_position - 1, rng),
+        [b")"],
+        generate_stream(size - basement_position, rng, b"()"),
+    )
+
+
+def generate_day02(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` presents."""
+
+    return generate_lines(
+        size, rng, lambda rng: "x".join(str(rng.randint(1, 30)) for _ in range(3))
+    )
+
+
+def generate_day03(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` directions."""
+
+    return generate_stream(size, rng, b"^v<>")
+
+
+def generate_day05(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` strings."""
+
+    return generate_lines(
+        size, rng, lambda rng: "".join(rng.choices(ascii_lowercase, k=16))
+    )
+
+
+def generate_day06(
+    size: int, rng: random.Random, grid_size: int = 1000
+) -> Iterator[bytes]:
+    """`size` instructions on a `grid_size`x`grid_size` grid."""
+
+    def generate_instruction(rng: random.Random) -> str:
+        x0, y0 = rng.randrange(grid_size), rng.randrange(grid_size)
+        x1, y1 = rng.randrange(x0, grid_size), rng.randrange(y0, grid_size)
+        action = rng.choice(("turn on", "turn off", "toggle"))
+
+        return f"{action} {x0},{y0} through {x1},{y1}"
+
+    return generate_lines(size, rng, generate_instruction)
+
+
+def _name_wire(number: int) -> str:
+    """Names of at least two letters, `a` is reserved for the output."""
+
+    name = ""
+    number += len(ascii_lowercase)
+    while number:
+        number, letter = divmod(number, len(ascii_lowercase))
+        name = ascii_lowercase[letter] + name
+
+    return name
+
+
+def generate_day07(size: int, rng: random.Random) -> Iterator[bytes]:
+    """A circuit of `size` wires that all feed into `a`.
+
+    Every gate only depends on wires defined before it. Wires are never connected
+    directly to another wire, the solution only supports signals and gates there.
+    """
+    n_signals = max(2, size // 10)
+    instructions = [
+        f"{rng.randrange(1 << 16)} -> {_name_wire(wire)}" for wire in range(n_signals)
+    ]
+    for wire in range(n_signals, size):
+        output = "a" if wire == size - 1 else _name_wire(wire)
+        left, right = _name_wire(rng.randrange(wire)), _name_wire(rng.randrange(wire))
+        match rng.randrange(4):
+            case 0:
+                gate = f"{left} AND {right}"
+            case 1:
+                gate = f"{left} OR {right}"
+            case 2:
+                gate = f"{left} {rng.choice(('LSHIFT', 'RSHIFT'))} {rng.randint(1, 15)}"
+            case 3:
+                gate = f"NOT {left}"
+        instructions.append(f"{gate} -> {output}")
+    rng.shuffle(instructions)
+
+    return encode_lines(instructions)
+
+
+def generate_day08(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` string literals."""
+
+    def generate_literal(rng: random.Random) -> str:
+        characters = []
+        for _ in range(rng.randint(1, 30)):
+            match rng.randrange(8):
+                case 0:
+                    characters.append('\\"')
+                case 1:
+                    characters.append("\\\\")
+                case 2:
+                    characters.append("\\x" + "".join(rng.choices(hexdigits[:16], k=2)))
+                case _:
+                    characters.append(rng.choice(ascii_lowercase))
+
+        return '"' + "".join(characters) + '"'
+
+    return generate_lines(size, rng, generate_literal)
+
+
+def generate_day09(size: int, rng: random.Random) -> Iterator[bytes]:
+    """Distances between all pairs of `size` cities."""
+
+    distances = (
+        f"City{a} to City{b} = {rng.randint(1, 200)}"
+        for a in range(size)
+        for b in range(a + 1, size)
+    )
+
+    return encode_lines(distances)
+
+
+def generate_day12(size: int, rng: random.Random) -> Iterator[bytes]:
+    """A JSON document with `size` numbers and strings."""
+
+    def generate_value(n_values: int) -> Union[int, str, list, dict]:
+        if n_values <= 1:
+            return rng.choice((rng.randint(-50, 200), rng.choice(COLORS)))
+        n_children = min(n_values, rng.randint(2, 10))
+        children = [
+            generate_value(n_values // n_children + (i < n_values % n_children))
+            for i in range(n_children)
+        ]
+        if rng.random() < 0.5:
+            return children
+
+        return dict(zip(ascii_lowercase, children))
+
+    yield json.dumps(generate_value(size), separators=(",", ":")).encode()
+
+
+def generate_day13(size: int, rng: random.Random) -> Iterator[bytes]:
+    """Happiness changes between all pairs of `size` attendees."""
+
+    changes = (
+        f"Person{a} would {rng.choice(('gain', 'lose'))} {rng.randint(0, 100)}"
+        f" happiness units by sitting next to Person{b}."
+        for a in range(size)
+        for b in range(size)
+        if a != b
+    )
+
+    return encode_lines(changes)
+
+
+def generate_day14(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` reindeer."""
+
+    return encode_lines(
+        f"Reindeer{reindeer} can fly {rng.randint(5, 30)} km/s"
+        f" for {rng.randint(2, 20)} seconds, but then must rest for"
+        f" {rng.randint(20, 200)} seconds."
+        for reindeer in range(size)
+    )
+
+
+def generate_day15(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` ingredients."""
+
+    return encode_lines(
+        f"Ingredient{ingredient}: capacity {rng.randint(-5, 5)},"
+        f" durability {rng.randint(-5, 5)}, flavor {rng.randint(-5, 5)},"
+        f" texture {rng.randint(-5, 5)}, calories {rng.randint(1, 9)}"
+        for ingredient in range(size)
+    )
+
+
+def generate_day16(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` aunts."""
+
+    return encode_lines(
+        f"Sue {number}: "
+        + ", ".join(
+            f"{attribute}: {rng.randint(0, 10)}"
+            for attribute in rng.sample(AUNT_ATTRIBUTES, 3)
+        )
+        for number in range(1, size + 1)
+    )
+
+
+def generate_day17(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` containers."""
+
+    return generate_lines(size, rng, lambda rng: str(rng.randint(1, 50)))
+
+
+def generate_day18(size: int, rng: random.Random) -> Iterator[bytes]:
+    """A `size`x`size` grid of lights."""
+
+    return generate_lines(
+        size, rng, lambda rng: b"".join(generate_stream(size, rng, b"#.")).decode()
+    )
+
+
+GENERATORS: dict[int, Callable[..., Iterator[bytes]]] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    16: generate_day16,
+    17: generate_day17,
+    18: generate_day18,
+}
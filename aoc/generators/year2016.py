@@ -0,0 +1,136 @@
+"""Generators for the inputs of 2016."""
+
+import random
+from collections import Counter
+from string import ascii_lowercase, ascii_uppercase
+from typing import Callable, Iterator
+
+from .common import CHUNK_SIZE, encode_lines, generate_lines, generate_word
+
+
+def generate_day01(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` instructions."""
+
+    instructions = (f"{rng.choice('LR')}{rng.randint(1, 20)}" for _ in range(size))
+
+    return encode_lines([", ".join(instructions)])
+
+
+def generate_day02(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` lines of instructions."""
+
+    return generate_lines(
+        size, rng, lambda rng: "".join(rng.choices("UDLR", k=rng.randint(400, 600)))
+    )
+
+
+def generate_day03(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` triangles, a multiple of three such that they can be read column-wise."""
+
+    return generate_lines(
+        size - size % 3,
+        rng,
+        lambda rng: "".join(f"{rng.randint(1, 999):5}" for _ in range(3)),
+    )
+
+
+def _generate_room_name(rng: random.Random) -> str:
+    """Words with at least 5 distinct letters, such that a checksum has 5 letters."""
+
+    while True:
+        name = "-".join(generate_word(rng, 2, 10) for _ in range(rng.randint(2, 5)))
+        if len(set(name) - {"-"}) >= 5:
+            return name
+
+
+def _encrypt_room(rng: random.Random) -> str:
+    name = _generate_room_name(rng)
+    if rng.random() < 0.5:  # real room
+        letter_counts = Counter(name.replace("-", ""))
+        checksum = "".join(
+            sorted(letter_counts, key=lambda letter: (-letter_counts[letter], letter))
+        )[:5]
+    else:
+        checksum = "".join(rng.sample(ascii_lowercase, 5))
+
+    return f"{name}-{rng.randint(100, 999)}[{checksum}]"
+
+
+def generate_day04(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` rooms, about half of them real."""
+
+    return generate_lines(size, rng, _encrypt_room)
+
+
+def generate_day06(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` repetitions of the message."""
+
+    return generate_lines(size, rng, lambda rng: generate_word(rng, 8, 8))
+
+
+def generate_day07(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` IPs."""
+
+    def generate_ip(rng: random.Random) -> str:
+        n_hypernets = rng.randint(1, 3)
+        supernets = [generate_word(rng, 5, 20) for _ in range(n_hypernets + 1)]
+        hypernets = [f"[{generate_word(rng, 5, 20)}]" for _ in range(n_hypernets)]
+
+        return "".join(s + h for s, h in zip(supernets, hypernets)) + supernets[-1]
+
+    return generate_lines(size, rng, generate_ip)
+
+
+def generate_day08(size: int, rng: random.Random) -> Iterator[bytes]:
+    """`size` operations on the 50x6 screen."""
+
+    def generate_operation(rng: random.Random) -> str:
+        match rng.randrange(3):
+            case 0:
+                return f"rect {rng.randint(1, 50)}x{rng.randint(1, 6)}"
+            case 1:
+                return f"rotate row y={rng.randrange(6)} by {rng.randint(1, 49)}"
+            case 2:
+                return f"rotate column x={rng.randrange(50)} by {rng.randint(1, 5)}"
+            case _:
+                raise ValueError("There are only 3 operations.")
+
+    return generate_lines(size, rng, generate_operation)
+
+
+def _compress(rng: random.Random, depth: int) -> str:
+    """Letters, or a marker followed by a sequence that is compressed `depth` times."""
+
+    if not depth or rng.random() < 0.3:
+        return "".join(rng.choices(ascii_uppercase, k=rng.randint(1, 20)))
+    sequence = "".join(_compress(rng, depth - 1) for _ in range(rng.randint(1, 4)))
+
+    return f"({len(sequence)}x{rng.randint(2, 12)}){sequence}"
+
+
+def generate_day09(size: int, rng: random.Random) -> Iterator[bytes]:
+    """About `size` characters of (nested) compressed sequences."""
+
+    chunk = ""
+    n_chars = 0
+    while n_chars < size:
+        sequence = _compress(rng, 3)
+        chunk += sequence
+        n_chars += len(sequence)
+        if len(chunk) >= CHUNK_SIZE:
+            yield chunk.encode()
+            chunk = ""
+
+    yield chunk.encode()
+
+
+GENERATORS: dict[int, Callable[..., Iterator[bytes]]] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+}
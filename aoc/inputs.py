@@ -0,0 +1,101 @@
+"""
+Shared readers for the puzzle inputs.
+
+Inputs are memory-mapped or read chunk by chunk instead of being loaded
+into a `str`, such that large (e.g., synthetic) inputs are never held
+in memory twice. Slices of a `memoryview` over the mapping are zero-copy.
+Mappings are context managers, they are closed when the `with` block is left,
+hence slices must not be kept beyond it.
+"""
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Final, Iterator, Union
+
+CHUNK_SIZE: Final[int] = 1 << 20
+
+Data = Union[str, bytes, bytearray, memoryview, mmap.mmap]
+
+
+@contextmanager
+def map_input(input_path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Memory-map the input read-only. Empty files can't be mapped, they are `b""`."""
+
+    with Path(input_path).open("rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+@contextmanager
+def view_input(input_path: str) -> Iterator[memoryview]:
+    with map_input(input_path) as data, memoryview(data) as view:
+        yield view
+
+
+def as_bytes(data: Data) -> memoryview:
+    """Byte view of the data; `str` is encoded, everything else is not copied."""
+
+    if isinstance(data, str):
+        return memoryview(data.encode())
+
+    return memoryview(data)
+
+
+def iter_chunks(input_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    with Path(input_path).open("rb") as file:
+        yield from iter_stream(file, chunk_size)
+
+
+def split_lines(input_path: str, chunk_size: int = CHUNK_SIZE) -> list[tuple[int, int]]:
+    """(start, stop) of chunks of at least `chunk_size` bytes but the last one.
+
+    Every chunk ends with a line break (or the end of the input), such that
+    the chunks can be parsed independently, e.g., in a process pool.
+    """
+    chunks = []
+    start = 0
+    with map_input(input_path) as data:
+        while start < len(data):
+            stop = data.find(b"\n", start + chunk_size - 1) + 1 or len(data)
+            chunks.append((start, stop))
+            start = stop
+
+    return chunks
+
+
+def iter_stream(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Chunks of a stream that can't be mapped, e.g., `sys.stdin.buffer`."""
+
+    while chunk := stream.read(chunk_size):
+        yield chunk
+
+
+def iter_line_blocks(input_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Blocks of whole lines, without the line break after a block's last line.
+
+    Lines can be parsed a block at a time with `bytes` methods, e.g., `split`.
+    """
+    buffer = bytearray()
+    with Path(input_path).open("rb") as file:
+        while chunk := file.read(chunk_size):
+            buffer += chunk
+            # Only the new chunk is searched, the buffer before it has no line break.
+            end = chunk.rfind(b"\n")
+            if end >= 0:
+                end += len(buffer) - len(chunk)
+                yield bytes(buffer[:end])
+                del buffer[: end + 1]
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_lines(input_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Lines without line breaks, decoded one chunk at a time."""
+
+    for block in iter_line_blocks(input_path, chunk_size):
+        yield from block.decode().split("\n")
@@ -0,0 +1,286 @@
+"""
+Mine MD5 hashes, as in 2015 day 4 and 2016 day 5.
+
+A nonce is a hit if the MD5 hash of a key followed by the nonce in decimal
+starts with a given number of zeros in hexadecimal. The nonces are split into
+blocks, which are mined in a process pool (see `aoc.workers`), and the hits
+are yielded in nonce order. Within a block, the MD5 state after the key is
+copied for every nonce instead of hashing the key again, and the raw digest
+is tested against a bound instead of formatting it in hexadecimal.
+Long searches can be checkpointed on disk (see `MiningCheckpoints`).
+Measure the throughput of mining the first hits with
+
+    python -m aoc.md5 <key> [<n_zeros>] [--hits <n>]
+"""
+import argparse
+import hashlib
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import count, islice
+from pathlib import Path
+from typing import Final, Generator, Optional
+
+from aoc.workers import default_workers
+
+ROOT: Final[Path] = Path(__file__).parent.parent
+CHECKPOINT_PATH: Final[Path] = ROOT / ".md5_checkpoints.sqlite"
+BLOCK_SIZE: Final[int] = 1 << 16
+DIGEST_SIZE: Final[int] = 16
+
+
+def digest_bound(n_zeros: int) -> bytes:
+    """Digests with `n_zeros` leading zeros in hexadecimal are less than the bound.
+
+    Digests compare like big-endian integers, each zero is worth 4 bits.
+    """
+    if not 0 < n_zeros <= 2 * DIGEST_SIZE:
+        raise ValueError(f"Expected 1 to {2 * DIGEST_SIZE} zeros, got {n_zeros}.")
+
+    return (1 << (8 * DIGEST_SIZE - 4 * n_zeros)).to_bytes(DIGEST_SIZE + 1)[1:]
+
+
+def mine_block(key: str, n_zeros: int, start: int, stop: int) -> list[tuple[int, str]]:
+    """Hits among the nonces from `start` to `stop` as (nonce, hexdigest)."""
+
+    keyed_md5 = hashlib.md5(key.encode())
+    bound = digest_bound(n_zeros)
+    hits = []
+    for nonce in range(start, stop):
+        md5 = keyed_md5.copy()
+        md5.update(b"%d" % nonce)
+        if md5.digest() < bound:
+            hits.append((nonce, md5.hexdigest()))
+
+    return hits
+
+
+@dataclass
+class Throughput:
+    n_hashes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def hashes_per_second(self) -> float:
+        return self.n_hashes / self.seconds if self.seconds else 0.0
+
+
+def mine_blocks(
+    key: str,
+    n_zeros: int,
+    start: int = 0,
+    max_workers: Optional[int] = None,
+    block_size: int = BLOCK_SIZE,
+    throughput: Optional[Throughput] = None,
+    executor: Optional[Executor] = None,
+) -> Generator[tuple[int, list[tuple[int, str]]], None, None]:
+    """Yields the hits of one block after the other as (stop, hits), see `mine`.
+
+    All nonces before `stop` have been mined, e.g., to checkpoint the search.
+    """
+    digest_bound(n_zeros)  # fail before starting the pool
+    max_workers = max_workers or default_workers()
+    if executor is None and max_workers == 1:
+        mined = (
+            (stop, mine_block(key, n_zeros, stop - block_size, stop))
+            for stop in count(start + block_size, block_size)
+        )
+    else:
+        mined = _mine_in_pool(key, n_zeros, start, max_workers, block_size, executor)
+
+    try:
+        started = time.perf_counter()
+        for stop, hits in mined:
+            if throughput is not None:
+                throughput.n_hashes += block_size
+                throughput.seconds += time.perf_counter() - started
+            yield stop, hits
+            started = time.perf_counter()
+    finally:
+        mined.close()
+
+
+def _mine_in_pool(
+    key: str,
+    n_zeros: int,
+    start: int,
+    max_workers: int,
+    block_size: int,
+    executor: Optional[Executor],
+) -> Generator[tuple[int, list[tuple[int, str]]], None, None]:
+    pool = executor or ProcessPoolExecutor(max_workers)
+    block_starts = count(start, block_size)
+    blocks: deque[Future] = deque()
+
+    def submit_block():
+        block_start = next(block_starts)
+        blocks.append(
+            pool.submit(mine_block, key, n_zeros, block_start, block_start + block_size)
+        )
+
+    try:
+        for _ in range(2 * max_workers):
+            submit_block()
+        for stop in count(start + block_size, block_size):
+            hits = blocks.popleft().result()
+            submit_block()
+            yield stop, hits
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+        else:
+            for block in blocks:
+                block.cancel()
+
+
+def mine(
+    key: str,
+    n_zeros: int,
+    start: int = 0,
+    max_workers: Optional[int] = None,
+    block_size: int = BLOCK_SIZE,
+    throughput: Optional[Throughput] = None,
+    executor: Optional[Executor] = None,
+) -> Generator[tuple[int, str], None, None]:
+    """Yields all hits from nonce `start` on as (nonce, hexdigest), in nonce order.
+
+    The search is endless, stop iterating once you've found enough hits.
+    Twice as many blocks as workers are in flight, such that workers never idle
+    while the hits of the oldest block are consumed.
+    If `throughput` is given, the hashes of every block that's been waited for
+    are counted, as well as the time spent mining (not consuming) the hits.
+    The pool has `max_workers` processes (see `aoc.workers`), a single worker
+    mines in this process. Pass an `executor` to share its pool between searches,
+    `max_workers` should match its size.
+    """
+    blocks = mine_blocks(
+        key, n_zeros, start, max_workers, block_size, throughput, executor
+    )
+    try:
+        for _, hits in blocks:
+            yield from hits
+    finally:
+        blocks.close()
+
+
+def count_zeros(digest: str) -> int:
+    return len(digest) - len(digest.lstrip("0"))
+
+
+class MiningCheckpoints:
+    """Mined ranges and hits on disk, such that searches resume where they stopped.
+
+    A search for `n_zeros` from `start` records that all nonces up to `stop` have
+    been mined, and all hits it found. Every hit with more zeros is a hit
+    with fewer zeros as well, hence a search resumes from the furthest range
+    mined for as many or fewer zeros, e.g., 6 zeros after 5 zeros.
+    """
+
+    def __init__(self, path: Path):
+        self.connection = sqlite3.connect(path, timeout=30)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS ranges ("
+                " key TEXT,"
+                " n_zeros INTEGER,"
+                " start INTEGER,"
+                " stop INTEGER,"
+                " PRIMARY KEY (key, n_zeros, start))"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS hits ("
+                " key TEXT,"
+                " nonce INTEGER,"
+                " digest TEXT,"
+                " PRIMARY KEY (key, nonce))"
+            )
+
+    def get_stop(self, key: str, n_zeros: int, start: int) -> int:
+        """All hits for `n_zeros` from `start` up to the stop have been recorded."""
+
+        (stop,) = self.connection.execute(
+            "SELECT MAX(stop) FROM ranges"
+            " WHERE key = ? AND n_zeros <= ? AND start = ?",
+            (key, n_zeros, start),
+        ).fetchone()
+
+        return start if stop is None else stop
+
+    def get_hits(
+        self, key: str, n_zeros: int, start: int, stop: int
+    ) -> list[tuple[int, str]]:
+        rows = self.connection.execute(
+            "SELECT nonce, digest FROM hits"
+            " WHERE key = ? AND nonce >= ? AND nonce < ? ORDER BY nonce",
+            (key, start, stop),
+        ).fetchall()
+
+        return [
+            (nonce, digest) for nonce, digest in rows if count_zeros(digest) >= n_zeros
+        ]
+
+    def put(
+        self,
+        key: str,
+        n_zeros: int,
+        start: int,
+        stop: int,
+        hits: list[tuple[int, str]],
+    ):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO hits VALUES (?, ?, ?)",
+                [(key, nonce, digest) for nonce, digest in hits],
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO ranges VALUES (?, ?, ?, ?)",
+                (key, n_zeros, start, stop),
+            )
+
+    def mine(
+        self, key: str, n_zeros: int, start: int = 0, **options
+    ) -> Generator[tuple[int, str], None, None]:
+        """Like `mine`, hits that have been recorded before are not mined again.
+
+        The range is checkpointed after every block, see `mine` for the options.
+        """
+        stop = self.get_stop(key, n_zeros, start)
+        yield from self.get_hits(key, n_zeros, start, stop)
+
+        blocks = mine_blocks(key, n_zeros, stop, **options)
+        try:
+            for stop, hits in blocks:
+                self.put(key, n_zeros, start, stop, hits)
+                yield from hits
+        finally:
+            blocks.close()
+
+    def close(self):
+        self.connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the MD5 mining throughput.")
+    parser.add_argument("key")
+    parser.add_argument("n_zeros", type=int, nargs="?", default=5)
+    parser.add_argument("--hits", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    throughput = Throughput()
+    mined = mine(
+        args.key, args.n_zeros, max_workers=args.workers, throughput=throughput
+    )
+    for nonce, digest in islice(mined, args.hits):
+        print(f"{nonce}: {digest}")
+    mined.close()
+    print(
+        f"{throughput.n_hashes} hashes in {throughput.seconds:.2f}s:"
+        f" {throughput.hashes_per_second:,.0f} hashes/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
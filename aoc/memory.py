@@ -0,0 +1,116 @@
+"""
+Measure the memory usage of the solutions.
+
+While `tracemalloc` is tracing, `aoc.result.measure` records the memory of each
+step (the setup and the parts): the peak of the memory allocated by Python on
+top of what was allocated before the step, the sites (`<file>:<line>`) that
+allocated most of the memory still alive after the step (e.g., caches or
+a parsed input), and the peak resident set size where the platform allows
+to reset it (Linux). Trace all solutions with
+
+    python -m aoc.runner --memory [--memory-budget <MiB>]
+"""
+import resource
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Final, NamedTuple, Optional
+
+ROOT: Final[Path] = Path(__file__).parent.parent
+N_TOP_SITES: Final[int] = 3
+
+
+class Memory(NamedTuple):
+    peak: int  # bytes on top of the memory allocated before
+    peak_rss: Optional[int]  # bytes, `None` if it can't be measured per step
+    top_sites: list[tuple[str, int]]  # (site, bytes)
+
+
+def reset_peak_rss() -> bool:
+    """Reset the peak RSS of this process, returns whether that's supported."""
+
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        return False
+
+    return True
+
+
+def read_peak_rss() -> int:
+    """Peak RSS in bytes, since the last reset if that's supported."""
+
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return max_rss if sys.platform == "darwin" else max_rss * 1024  # kB on Linux
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+    )
+
+
+def _label_site(statistic: tracemalloc.StatisticDiff) -> str:
+    frame = statistic.traceback[0]
+    path = Path(frame.filename)
+    if path.is_relative_to(ROOT):
+        path = path.relative_to(ROOT)
+
+    return f"{path}:{frame.lineno}"
+
+
+class MemoryTracker:
+    """Tracks the memory of one step, use it as a context manager."""
+
+    def __enter__(self) -> "MemoryTracker":
+        self.memory: Optional[Memory] = None
+        self.rss_resettable = reset_peak_rss()
+        self.snapshot = _take_snapshot()
+        tracemalloc.reset_peak()
+        self.start, _ = tracemalloc.get_traced_memory()
+
+        return self
+
+    def __exit__(self, *exception):
+        _, peak = tracemalloc.get_traced_memory()
+        statistics = _take_snapshot().compare_to(self.snapshot, "lineno")
+        peak_rss = read_peak_rss() if self.rss_resettable else None
+        top_sites = [
+            (_label_site(statistic), statistic.size_diff)
+            for statistic in statistics[:N_TOP_SITES]
+            if statistic.size_diff > 0
+        ]
+        self.memory = Memory(peak - self.start, peak_rss, top_sites)
+
+
+def check_budget(memory: dict[str, Memory], budget: float) -> Optional[str]:
+    """Budget in MiB, applies to the peak of each step."""
+
+    for name, step_memory in memory.items():
+        if step_memory.peak > budget * 2**20:
+            return (
+                f"{name} peaked at {step_memory.peak / 2**20:.1f} MiB,"
+                f" more than the budget of {budget:.1f} MiB."
+            )
+
+    return None
+
+
+def format_memory(name: str, memory: Memory) -> str:
+    line = f"{name}: {memory.peak / 2**20:.2f} MiB peak"
+    if memory.peak_rss is not None:
+        line += f", {memory.peak_rss / 2**20:.1f} MiB peak RSS"
+    for site, size in memory.top_sites:
+        line += f"\n        {site}: {size / 2**10:.1f} KiB"
+
+    return line
@@ -0,0 +1,136 @@
+"""
+Profile the solutions.
+
+A solution runs under `cProfile`, which counts the calls of every function,
+and under a sampling profiler, which records the call stack at a fixed
+interval of CPU time. The samples are written as collapsed stacks,
+one `caller;callee count` line per distinct stack, as consumed by
+flamegraph tools (e.g., `flamegraph.pl`, speedscope, or inferno).
+Profile all solutions with
+
+    python -m aoc.runner --profile <directory>
+"""
+import cProfile
+import pstats
+import signal
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Final, NamedTuple, Optional
+
+SAMPLING_INTERVAL: Final[float] = 0.001
+
+# Functions reported per day, other days report their most expensive functions.
+HOT_FUNCTIONS: Final[dict[str, tuple[str, ...]]] = {
+    "2015/day18": ("compute_light_state",),
+    "2015/day19": ("find_molecule_parents", "revert_molecule"),
+    "2015/day22": ("play_two_turns", "play"),
+}
+
+
+class FunctionStats(NamedTuple):
+    n_calls: int
+    own_time: float  # without the time spent in callees
+    cumulative_time: float
+
+
+@dataclass
+class Profile:
+    # Keyed by `<path>:<function>`, see `collect_function_stats`.
+    functions: dict[str, FunctionStats] = field(default_factory=dict)
+    stacks: Counter[str] = field(default_factory=Counter)
+
+    def find_hot_functions(
+        self, path: Path, names: tuple[str, ...] = (), n_functions: int = 3
+    ) -> dict[str, FunctionStats]:
+        """The named functions defined in `path`, or its most expensive ones."""
+
+        prefix = f"{path}:"
+        functions = {
+            name.removeprefix(prefix): stats
+            for name, stats in self.functions.items()
+            if name.startswith(prefix)
+        }
+        if names:
+            return {name: functions[name] for name in names if name in functions}
+
+        most_expensive = sorted(
+            functions, key=lambda name: functions[name].own_time, reverse=True
+        )
+
+        return {name: functions[name] for name in most_expensive[:n_functions]}
+
+    def write_collapsed_stacks(self, path: Path):
+        Path(path).write_text(
+            "".join(
+                f"{stack} {count}\n" for stack, count in sorted(self.stacks.items())
+            )
+        )
+
+
+def collect_function_stats(profiler: cProfile.Profile) -> dict[str, FunctionStats]:
+    """Stats of every profiled function, times are rounded to milliseconds."""
+
+    functions = {}
+    stats_profile = pstats.Stats(profiler).get_stats_profile()
+    for name, stats in stats_profile.func_profiles.items():
+        n_calls = int(stats.ncalls.split("/")[0])  # "<calls>/<primitive calls>"
+        functions[f"{stats.file_name}:{name}"] = FunctionStats(
+            n_calls, stats.tottime, stats.cumtime
+        )
+
+    return functions
+
+
+def _label_frame(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+
+
+def profile(function: Callable, *args) -> tuple[Any, Profile]:
+    """Returns the function's result and its profile.
+
+    Sampling relies on `SIGPROF`, hence no stacks are recorded outside
+    the main thread or on platforms without it.
+    Stacks are cut below the profiled function.
+    """
+    function_profile = Profile()
+
+    def sample(signum: int, frame: Optional[FrameType]):
+        stack = []
+        while frame is not None and frame.f_code is not profile.__code__:
+            stack.append(_label_frame(frame))
+            frame = frame.f_back
+        if stack:
+            function_profile.stacks[";".join(reversed(stack))] += 1
+
+    sampling = (
+        hasattr(signal, "SIGPROF")
+        and threading.current_thread() is threading.main_thread()
+    )
+    if sampling:
+        signal.signal(signal.SIGPROF, sample)
+        signal.setitimer(signal.ITIMER_PROF, SAMPLING_INTERVAL, SAMPLING_INTERVAL)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = function(*args)
+    finally:
+        profiler.disable()
+        if sampling:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    function_profile.functions = collect_function_stats(profiler)
+    function_profile.functions.pop(f"{__file__}:{sample.__name__}", None)
+
+    return result, function_profile
+
+
+def format_function_stats(name: str, stats: FunctionStats) -> str:
+    return (
+        f"{name}: {stats.n_calls} calls, {stats.own_time:.3f}s"
+        f" ({stats.cumulative_time:.3f}s cumulative)"
+    )
@@ -0,0 +1,70 @@
+"""
+Structured results of a day's solution.
+
+Every `solution.py` exposes `run(...) -> Result` next to its printing
+`solve*` functions, such that answers can be collected in-process.
+"""
+import sys
+import time
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from aoc.memory import Memory, MemoryTracker
+
+
+class Result(NamedTuple):
+    part1: Any
+    part2: Any
+    timings: dict[str, float]
+    memory: Optional[dict[str, "Memory"]] = None  # only while `tracemalloc` is tracing
+
+
+def track_memory() -> AbstractContextManager[Optional["MemoryTracker"]]:
+    """A `MemoryTracker` while `tracemalloc` is tracing, a no-op otherwise."""
+
+    # `tracemalloc` is slow to import, only look it up if it's been imported.
+    tracemalloc = sys.modules.get("tracemalloc")
+    if tracemalloc is None or not tracemalloc.is_tracing():
+        return nullcontext()
+
+    from aoc.memory import MemoryTracker
+
+    return MemoryTracker()
+
+
+def measure(
+    part1: Optional[Callable] = None,
+    part2: Optional[Callable] = None,
+    setup: Optional[Callable[[], Any]] = None,
+) -> Result:
+    """Time each part of a solution.
+
+    If `setup` is given, its return value (e.g., the parsed input)
+    is passed to both parts. Otherwise, the parts are called without arguments.
+    While `tracemalloc` is tracing, the memory of each step is measured as well
+    (see `aoc.memory`).
+    """
+    timings: dict[str, float] = {}
+    memory: dict[str, Memory] = {}
+
+    def run_step(name: str, step: Callable, *args) -> Any:
+        with track_memory() as tracker:
+            start = time.perf_counter()
+            answer = step(*args)
+            timings[name] = time.perf_counter() - start
+        if tracker is not None and tracker.memory is not None:
+            memory[name] = tracker.memory
+
+        return answer
+
+    args: tuple = ()
+    if setup is not None:
+        args = (run_step("setup", setup),)
+
+    answers: dict[str, Any] = {}
+    for name, part in (("part1", part1), ("part2", part2)):
+        if part is not None:
+            answers[name] = run_step(name, part, *args)
+
+    return Result(answers.get("part1"), answers.get("part2"), timings, memory)
@@ -0,0 +1,290 @@
+"""
+Run every solution in a process pool.
+
+The solutions under `year<year>/day<day>/solution.py` are discovered on disk
+and their `run` entry points are called in worker processes.
+Answers are served from the on-disk cache (see `aoc.cache`) unless the day's
+input or solution changed.
+Days are scheduled longest-expected-job-first, such that the total wall time
+approaches the time of the slowest day rather than the sum over all days.
+Days that start process pools of their own share the cores (see `aoc.workers`).
+
+With `--memory`, the memory of every step of a day is traced (see `aoc.memory`)
+in a fresh worker process instead of served from the cache. With
+`--memory-budget <MiB>`, days whose steps exceed the budget fail.
+With `--profile <directory>`, every day is profiled (see `aoc.profiling`) instead
+of served from the cache, its hot functions are reported, and its sampled stacks
+are written to `<directory>/<year>_day<day>.folded`.
+
+Usage:
+
+    python -m aoc.runner [--year 2015] [--day 4] [--workers 4] [--no-cache]
+                         [--memory] [--memory-budget 100] [--profile profiles]
+
+"""
+import argparse
+import importlib
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Iterable, Iterator, Optional
+
+from aoc.result import Result
+from aoc.workers import set_worker_budget
+
+if TYPE_CHECKING:
+    from aoc.profiling import FunctionStats
+
+ROOT: Final[Path] = Path(__file__).parent.parent
+CACHE_PATH: Final[Path] = ROOT / ".answers.sqlite"
+
+# Approximate run times in seconds, used for scheduling only.
+EXPECTED_DURATIONS: Final[dict[str, float]] = {
+    "2015/day20": 37.0,
+    "2015/day22": 30.0,
+    "2016/day05": 14.0,
+    "2015/day10": 3.0,
+    "2015/day11": 2.4,
+    "2015/day25": 2.0,
+    "2015/day15": 1.9,
+    "2015/day19": 1.6,
+    "2015/day18": 1.5,
+    "2015/day04": 1.0,
+    "2015/day13": 0.6,
+    "2015/day06": 0.1,
+}
+
+
+@dataclass(frozen=True)
+class Day:
+    year: int
+    day: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/day{self.day:02}"
+
+    @property
+    def path(self) -> Path:
+        return ROOT / f"year{self.year}" / f"day{self.day:02}" / "solution.py"
+
+    @property
+    def module(self) -> str:
+        return f"year{self.year}.day{self.day:02}.solution"
+
+
+@dataclass
+class Report:
+    day: Day
+    result: Optional[Result]
+    wall_time: float
+    cpu_time: float
+    error: str = ""
+    cached: bool = False
+    hot_functions: dict[str, "FunctionStats"] = field(default_factory=dict)
+
+
+def discover_days(years: Iterable[int] = (), days: Iterable[int] = ()) -> list[Day]:
+    years, days = set(years), set(days)
+    discovered_days = []
+
+    for path in sorted(ROOT.glob("year*/day*/solution.py")):
+        day = Day(
+            int(path.parent.parent.name.removeprefix("year")),
+            int(path.parent.name.removeprefix("day")),
+        )
+        if years and day.year not in years:
+            continue
+        if days and day.day not in days:
+            continue
+        discovered_days.append(day)
+
+    return discovered_days
+
+
+def schedule(days: Iterable[Day]) -> list[Day]:
+    """Longest expected job first."""
+
+    return sorted(
+        days, key=lambda day: EXPECTED_DURATIONS.get(day.name, 0.0), reverse=True
+    )
+
+
+def profile_day(day: Day, profile_dir: Path) -> tuple[Result, dict]:
+    """Returns the day's result and its hot functions, and writes its stacks."""
+
+    from aoc.profiling import HOT_FUNCTIONS, profile  # cProfile is slow to import
+
+    module = importlib.import_module(day.module)
+    result, day_profile = profile(module.run)
+    day_profile.write_collapsed_stacks(
+        Path(profile_dir) / f"{day.year}_day{day.day:02}.folded"
+    )
+
+    return result, day_profile.find_hot_functions(
+        day.path, HOT_FUNCTIONS.get(day.name, ())
+    )
+
+
+def trace_day(day: Day) -> Result:
+    import tracemalloc  # slow to import
+
+    module = importlib.import_module(day.module)
+    tracemalloc.start()
+    try:
+        return module.run()
+    finally:
+        tracemalloc.stop()
+
+
+def measure_cpu_time() -> float:
+    """CPU time of this process and its children (e.g., a day's own process pool).
+
+    Children only count once they've been waited for, which the pools do when
+    they shut down.
+    """
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    return time.process_time() + usage.ru_utime + usage.ru_stime
+
+
+def run_day(
+    day: Day,
+    cache_path: Optional[Path] = None,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+    memory_budget: Optional[float] = None,
+) -> Report:
+    """With a `memory_budget` in MiB, memory is traced and the budget is checked."""
+
+    result = None
+    error = ""
+    cached = False
+    hot_functions: dict[str, "FunctionStats"] = {}
+
+    wall_start = time.perf_counter()
+    cpu_start = measure_cpu_time()
+    try:
+        module = importlib.import_module(day.module)
+        if profile_dir is not None:
+            result, hot_functions = profile_day(day, profile_dir)
+        elif trace_memory or memory_budget is not None:
+            result = trace_day(day)
+            if memory_budget is not None:
+                from aoc.memory import check_budget
+
+                if budget_exceeded := check_budget(result.memory or {}, memory_budget):
+                    error = f"MemoryBudgetExceeded: {budget_exceeded}"
+        elif cache_path is None:
+            result = module.run()
+        else:
+            from aoc.cache import AnswerCache  # sqlite3 is only needed when caching
+
+            with closing(AnswerCache(cache_path)) as cache:
+                result, cached = cache.run(module)
+    except Exception as exception:
+        error = f"{type(exception).__name__}: {exception}"
+    cpu_time = measure_cpu_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    return Report(day, result, wall_time, cpu_time, error, cached, hot_functions)
+
+
+def run_days(
+    days: Iterable[Day],
+    max_workers: Optional[int] = None,
+    cache_path: Optional[Path] = None,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+    memory_budget: Optional[float] = None,
+) -> Iterator[Report]:
+    trace_memory = trace_memory or memory_budget is not None
+    # The peak RSS of a process covers all days it ran, hence one process per day.
+    max_tasks_per_child = 1 if trace_memory else None
+    # The days' own process pools share the cores, see `aoc.workers`.
+    worker_budget = (os.cpu_count() or 1) // (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers,
+        max_tasks_per_child=max_tasks_per_child,
+        initializer=set_worker_budget,
+        initargs=(worker_budget,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                run_day, day, cache_path, profile_dir, trace_memory, memory_budget
+            )
+            for day in schedule(days)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int, action="append", default=[])
+    parser.add_argument("--day", type=int, action="append", default=[])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--memory", action="store_true")
+    parser.add_argument("--memory-budget", type=float, default=None, metavar="MIB")
+    parser.add_argument("--profile", type=Path, default=None, metavar="DIRECTORY")
+    args = parser.parse_args()
+    if args.profile is not None:
+        args.profile.mkdir(parents=True, exist_ok=True)
+
+    wall_start = time.perf_counter()
+    reports = sorted(
+        run_days(
+            discover_days(args.year, args.day),
+            args.workers,
+            None if args.no_cache else CACHE_PATH,
+            args.profile,
+            args.memory,
+            args.memory_budget,
+        ),
+        key=lambda report: (report.day.year, report.day.day),
+    )
+    wall_time = time.perf_counter() - wall_start
+
+    for report in reports:
+        cached = ", cached" if report.cached else ""
+        print(f"=== {report.day.name} ({report.wall_time:.2f}s{cached}) ===\n")
+        if report.error:
+            print(f"Failed with {report.error}\n")
+        if report.result is None:
+            continue
+        for part, answer in enumerate((report.result.part1, report.result.part2), 1):
+            if answer is not None:
+                print(f"Part {part}:\n{answer}\n")
+        if report.hot_functions:
+            from aoc.profiling import format_function_stats
+
+            print("Hot functions:")
+            for name, stats in report.hot_functions.items():
+                print(f"    {format_function_stats(name, stats)}")
+            print()
+        if report.result.memory:
+            from aoc.memory import format_memory
+
+            print("Memory:")
+            for name, memory in report.result.memory.items():
+                print(f"    {format_memory(name, memory)}")
+            print()
+
+    cpu_time = sum(report.cpu_time for report in reports)
+    n_failed = sum(bool(report.error) for report in reports)
+    print(
+        f"Ran {len(reports)} days ({n_failed} failed) in {wall_time:.2f}s wall time,"
+        f" {cpu_time:.2f}s summed CPU time ({cpu_time / wall_time:.1f}x).\n"
+    )
+    if n_failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
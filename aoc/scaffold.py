@@ -0,0 +1,46 @@
+"""
+Scaffold a new day from the template in `day00`.
+
+    python -m aoc.scaffold <year> <day>
+
+creates `year<year>/day<day>` with a `solution.py` exposing `run`, its tests,
+its benchmarks, and an empty `input.txt`. There's no registry to update:
+the runner discovers the new day on disk (see `aoc.runner.discover_days`),
+the cache keys it by its module, and `pytest` collects its tests.
+"""
+import argparse
+import shutil
+from pathlib import Path
+from typing import Final
+
+ROOT: Final[Path] = Path(__file__).parent.parent
+TEMPLATE_PATH: Final[Path] = ROOT / "day00"
+
+
+def scaffold_day(year: int, day: int, root: Path = ROOT) -> Path:
+    year_path = Path(root) / f"year{year}"
+    day_path = year_path / f"day{day:02}"
+    if day_path.exists():
+        raise FileExistsError(f"{day_path} already exists.")
+
+    year_path.mkdir(exist_ok=True)
+    (year_path / "__init__.py").touch()
+    shutil.copytree(
+        TEMPLATE_PATH, day_path, ignore=shutil.ignore_patterns("__pycache__")
+    )
+
+    return day_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    args = parser.parse_args()
+
+    day_path = scaffold_day(args.year, args.day)
+    print(f"Created {day_path.relative_to(ROOT)}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import pytest
+from . import benchmark
+
+
+def test_time_function():
+    result, seconds = benchmark.time_function(sum, [1, 2, 3], rounds=2)
+
+    assert result == 6
+    assert seconds >= 0
+
+
+@pytest.mark.parametrize(
+    "seconds, baseline, threshold, regressed",
+    [
+        (1.1, 1.0, 20.0, False),
+        (1.3, 1.0, 20.0, True),
+        (0.5, 1.0, 0.0, False),
+        (5.0, None, 20.0, False),
+    ],
+)
+def test_check_regression(
+    seconds: float, baseline: float, threshold: float, regressed: bool
+):
+    assert bool(benchmark.check_regression(seconds, baseline, threshold)) == regressed
+
+
+def test_baselines_roundtrip(tmp_path):
+    path = tmp_path / "benchmarks.json"
+
+    assert benchmark.load_baselines(path) == {}
+    benchmark.save_baselines({"a::b": 0.5}, path)
+    assert benchmark.load_baselines(path) == {"a::b": 0.5}
+
+
+def test_measure_scaling(tmp_path):
+    curve = benchmark.measure_scaling(2015, 1, [10, 100], tmp_path)
+
+    assert [size for size, _ in curve] == [10, 100]
+    assert all(set(result.timings) == {"part1", "part2"} for _, result in curve)
@@ -0,0 +1,74 @@
+import importlib
+
+import pytest
+from year2015.day01 import solution
+from . import cache
+
+
+@pytest.fixture
+def answer_cache(tmp_path):
+    answer_cache = cache.AnswerCache(tmp_path / "answers.sqlite")
+    yield answer_cache
+    answer_cache.close()
+
+
+def test_cache_hit(answer_cache, tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("(()(()(")
+
+    result, cached = answer_cache.run(solution, str(input_path))
+    assert not cached
+    assert result.part1 == 3
+
+    result, cached = answer_cache.run(solution, str(input_path))
+    assert cached
+    assert result.part1 == 3
+
+
+def test_cache_invalidated_by_input(answer_cache, tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("(()(()(")
+    answer_cache.run(solution, str(input_path))
+
+    input_path.write_text(")())())")
+    result, cached = answer_cache.run(solution, str(input_path))
+    assert not cached
+    assert result.part1 == -3
+
+
+def test_hash_input_literal():
+    assert cache.hash_input("bgvyzdsv") == cache.hash_input("bgvyzdsv")
+    assert cache.hash_input("bgvyzdsv") != cache.hash_input("abcdef")
+
+
+def test_cache_invalidated_by_imported_module(answer_cache, tmp_path, monkeypatch):
+    (tmp_path / "cache_test_helper.py").write_text("ANSWER = 1\n")
+    (tmp_path / "cache_test_day.py").write_text(
+        "from aoc.result import Result\n"
+        "import cache_test_helper\n\n\n"
+        "def run():\n"
+        "    return Result(cache_test_helper.ANSWER, None, {})\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(cache, "ROOT", tmp_path)
+    day = importlib.import_module("cache_test_day")
+
+    _, cached = answer_cache.run(day)
+    assert not cached
+    _, cached = answer_cache.run(day)
+    assert cached
+
+    (tmp_path / "cache_test_helper.py").write_text("ANSWER = 2\n")
+    _, cached = answer_cache.run(day)
+    assert not cached
+
+
+def test_find_local_modules():
+    from year2015.day04 import solution as day04
+
+    assert sorted(cache.find_local_modules(day04)) == [
+        "aoc.md5",
+        "aoc.result",
+        "aoc.workers",
+        "year2015.day04.solution",
+    ]
@@ -0,0 +1,112 @@
+import io
+import mmap
+
+import pytest
+from . import inputs
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"2x3x4\n1x1x10\n10x2x3")
+
+    return str(path)
+
+
+def test_map_input(input_path: str):
+    with inputs.map_input(input_path) as data:
+        assert isinstance(data, mmap.mmap)
+        assert data[:] == b"2x3x4\n1x1x10\n10x2x3"
+
+    assert data.closed
+
+
+def test_map_empty_input(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.touch()
+
+    with inputs.map_input(str(path)) as data:
+        assert data == b""
+
+
+def test_view_input_slices_without_copy(input_path: str):
+    with inputs.view_input(input_path) as view, view[6:12] as line:
+        assert isinstance(line, memoryview)
+        assert line.tobytes() == b"1x1x10"
+
+
+def test_view_input_is_released(input_path: str):
+    with inputs.view_input(input_path) as view:
+        pass
+
+    with pytest.raises(ValueError):
+        view.tobytes()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 7, 1 << 20])
+def test_iter_chunks(input_path: str, chunk_size: int):
+    chunks = list(inputs.iter_chunks(input_path, chunk_size))
+
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert b"".join(chunks) == b"2x3x4\n1x1x10\n10x2x3"
+
+
+def test_iter_stream():
+    chunks = list(inputs.iter_stream(io.BytesIO(b"(()))("), 4))
+
+    assert chunks == [b"(())", b")("]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 7, 1 << 20])
+def test_iter_line_blocks(input_path: str, chunk_size: int):
+    blocks = list(inputs.iter_line_blocks(input_path, chunk_size))
+
+    assert b"\n".join(blocks) == b"2x3x4\n1x1x10\n10x2x3"
+    assert not any(block.startswith(b"\n") or block.endswith(b"\n") for block in blocks)
+
+
+def test_iter_line_blocks_long_line(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"1x1x1\n" + b"9" * 1000 + b"x1x1\n2x2x2")
+
+    blocks = list(inputs.iter_line_blocks(str(path), 7))
+
+    assert b"\n".join(blocks).split(b"\n") == [
+        b"1x1x1",
+        b"9" * 1000 + b"x1x1",
+        b"2x2x2",
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 7, 1 << 20])
+def test_iter_lines(input_path: str, chunk_size: int):
+    assert list(inputs.iter_lines(input_path, chunk_size)) == [
+        "2x3x4",
+        "1x1x10",
+        "10x2x3",
+    ]
+
+
+@pytest.mark.parametrize(
+    "chunk_size, chunks",
+    [
+        (1, [(0, 6), (6, 13), (13, 19)]),
+        (6, [(0, 6), (6, 13), (13, 19)]),
+        (7, [(0, 13), (13, 19)]),
+        (1 << 20, [(0, 19)]),
+    ],
+)
+def test_split_lines(input_path: str, chunk_size: int, chunks: list[tuple[int, int]]):
+    assert inputs.split_lines(input_path, chunk_size) == chunks
+
+
+def test_split_empty_lines(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.touch()
+
+    assert inputs.split_lines(str(path)) == []
+
+
+@pytest.mark.parametrize("data", ["()(", b"()(", bytearray(b"()("), memoryview(b"()(")])
+def test_as_bytes(data: inputs.Data):
+    assert inputs.as_bytes(data).tobytes() == b"()("
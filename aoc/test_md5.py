@@ -0,0 +1,136 @@
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import pytest
+from . import md5
+
+
+@pytest.mark.parametrize("n_zeros", [1, 2, 5, 6, 31, 32])
+def test_digest_bound(n_zeros: int):
+    bound = md5.digest_bound(n_zeros)
+
+    assert len(bound) == md5.DIGEST_SIZE
+    assert bytes.fromhex("0" * n_zeros + "f" * (32 - n_zeros)) < bound
+    if n_zeros > 1:
+        assert bytes.fromhex("0" * (n_zeros - 1) + "1" + "0" * (32 - n_zeros)) >= bound
+
+
+@pytest.mark.parametrize("n_zeros", [0, 33])
+def test_digest_bound_out_of_range(n_zeros: int):
+    with pytest.raises(ValueError):
+        md5.digest_bound(n_zeros)
+
+
+@pytest.mark.parametrize("n_zeros", [1, 2, 3])
+def test_mine_block_matches_hexdigest(n_zeros: int):
+    expected = []
+    for nonce in range(5000):
+        digest = hashlib.md5(f"abc{nonce}".encode()).hexdigest()
+        if digest.startswith("0" * n_zeros):
+            expected.append((nonce, digest))
+
+    assert md5.mine_block("abc", n_zeros, 0, 5000) == expected
+
+
+def test_mine_block():
+    assert md5.mine_block("abcdef", 5, 609000, 609100) == [
+        (609043, "000001dbbfa3a5c83a2d506429c7b00e")
+    ]
+
+
+def test_mine_block_without_hits():
+    assert md5.mine_block("abcdef", 5, 0, 1000) == []
+
+
+def test_mine_yields_hits_in_nonce_order():
+    hits = list(islice(md5.mine("abc", 1, max_workers=2, block_size=7), 20))
+    nonces = [nonce for nonce, _ in hits]
+
+    assert nonces == sorted(nonces)
+    assert hits == md5.mine_block("abc", 1, 0, nonces[-1] + 1)
+
+
+def test_mine_from_start():
+    nonce, digest = next(md5.mine("abc", 2, start=100, block_size=64))
+
+    assert nonce >= 100
+    assert digest.startswith("00")
+    assert not md5.mine_block("abc", 2, 100, nonce)
+
+
+def test_mine_counts_throughput():
+    throughput = md5.Throughput()
+    mined = md5.mine("abc", 1, max_workers=1, block_size=100, throughput=throughput)
+    next(mined)
+    mined.close()
+
+    assert throughput.n_hashes == 100
+    assert throughput.hashes_per_second > 0
+
+
+@pytest.fixture
+def checkpoints(tmp_path):
+    checkpoints = md5.MiningCheckpoints(tmp_path / "checkpoints.sqlite")
+    yield checkpoints
+    checkpoints.close()
+
+
+def test_checkpoints_serve_recorded_hits(checkpoints, monkeypatch):
+    hits = list(islice(checkpoints.mine("abc", 2, block_size=64), 3))
+    monkeypatch.setattr(md5, "mine_blocks", None)  # mining again would fail
+
+    assert list(islice(checkpoints.mine("abc", 2), 3)) == hits
+
+
+def test_checkpoints_resume_more_zeros(checkpoints, monkeypatch):
+    next(checkpoints.mine("abc", 1, start=1, block_size=64))
+    stop = checkpoints.get_stop("abc", 1, 1)
+    starts = []
+    mine_blocks = md5.mine_blocks
+
+    def record_start(key, n_zeros, start, *args, **options):
+        starts.append(start)
+        return mine_blocks(key, n_zeros, start, *args, **options)
+
+    monkeypatch.setattr(md5, "mine_blocks", record_start)
+    hit = next(checkpoints.mine("abc", 3, start=1, block_size=64))
+
+    assert stop == 65
+    assert starts == [stop]
+    assert hit == md5.mine_block("abc", 3, 1, hit[0] + 1)[0]
+
+
+def test_checkpoints_resume_after_interruption(tmp_path):
+    path = tmp_path / "checkpoints.sqlite"
+    checkpoints = md5.MiningCheckpoints(path)
+    hits = list(islice(checkpoints.mine("abc", 2, block_size=100), 2))
+    checkpoints.close()
+
+    checkpoints = md5.MiningCheckpoints(path)
+    hits += list(islice(checkpoints.mine("abc", 2, block_size=100), 2, 5))
+    checkpoints.close()
+
+    assert hits == list(islice(md5.mine("abc", 2), 5))
+
+
+def test_checkpoints_ignore_other_keys(checkpoints):
+    next(checkpoints.mine("abc", 2))
+
+    assert checkpoints.get_stop("abd", 2, 0) == 0
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_mine_with_workers(max_workers: int):
+    hits = list(islice(md5.mine("abc", 2, max_workers=max_workers, block_size=50), 5))
+
+    assert hits == md5.mine_block("abc", 2, 0, hits[-1][0] + 1)
+
+
+def test_mine_shares_executor():
+    with ProcessPoolExecutor(2) as executor:
+        first = next(md5.mine("abc", 2, max_workers=2, executor=executor))
+        second = next(md5.mine("abd", 2, max_workers=2, executor=executor))
+
+    assert first == next(md5.mine("abc", 2, max_workers=1))
+    assert second == next(md5.mine("abd", 2, max_workers=1))
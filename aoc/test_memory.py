@@ -0,0 +1,44 @@
+import tracemalloc
+
+import pytest
+from . import memory, result
+
+
+@pytest.fixture
+def tracing():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+def allocate(size: int) -> int:
+    return len(bytearray(size))
+
+
+def test_measure_memory(tracing):
+    measured = result.measure(allocate, lambda size: bytes(size), setup=lambda: 2**20)
+
+    assert set(measured.memory) == {"setup", "part1", "part2"}
+    assert measured.memory["part1"].peak >= 2**20
+    assert measured.memory["part2"].peak >= 2**20
+    assert measured.memory["setup"].peak < 2**20
+
+
+def test_measure_memory_top_sites(tracing):
+    cache = []
+    measured = result.measure(lambda: cache.append(bytearray(2**20)))
+    [(site, size)] = measured.memory["part1"].top_sites[:1]
+
+    assert site.startswith("aoc/test_memory.py:")
+    assert size >= 2**20
+
+
+@pytest.mark.parametrize("budget, exceeded", [(2.0, False), (0.5, True)])
+def test_check_budget(budget: float, exceeded: bool):
+    step_memory = {"part1": memory.Memory(2**20, None, [])}
+
+    assert bool(memory.check_budget(step_memory, budget)) == exceeded
+
+
+def test_read_peak_rss():
+    assert memory.read_peak_rss() > 0
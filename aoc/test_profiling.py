@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from . import profiling
+
+
+def square(number: int) -> int:
+    return number * number
+
+
+def sum_squares(n: int) -> int:
+    return sum(square(number) for number in range(n))
+
+
+def test_profile_counts_calls():
+    result, profile = profiling.profile(sum_squares, 100_000)
+    hot_functions = profile.find_hot_functions(Path(__file__), ("square",))
+
+    assert result == sum(number * number for number in range(100_000))
+    assert hot_functions["square"].n_calls == 100_000
+    assert hot_functions["square"].cumulative_time >= hot_functions["square"].own_time
+
+
+def test_profile_samples_stacks(tmp_path):
+    _, profile = profiling.profile(sum_squares, 1_000_000)
+    profile.write_collapsed_stacks(tmp_path / "stacks.folded")
+
+    assert sum(profile.stacks.values()) > 0
+    assert all(
+        stack.startswith("aoc.test_profiling:sum_squares") for stack in profile.stacks
+    )
+    for line in (tmp_path / "stacks.folded").read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert profile.stacks[stack] == int(count)
+
+
+def test_find_hot_functions_most_expensive():
+    profile = profiling.Profile(
+        {
+            "solution.py:a": profiling.FunctionStats(1, 0.1, 0.5),
+            "solution.py:b": profiling.FunctionStats(1, 0.3, 0.3),
+            "solution.py:c": profiling.FunctionStats(1, 0.2, 0.2),
+            "other.py:d": profiling.FunctionStats(1, 0.9, 0.9),
+        }
+    )
+
+    assert list(profile.find_hot_functions(Path("solution.py"), n_functions=2)) == [
+        "b",
+        "c",
+    ]
@@ -0,0 +1,26 @@
+from . import result
+
+
+def test_measure():
+    measured = result.measure(lambda: 1, lambda: 2)
+
+    assert (measured.part1, measured.part2) == (1, 2)
+    assert set(measured.timings) == {"part1", "part2"}
+
+
+def test_measure_with_setup():
+    measured = result.measure(len, sum, setup=lambda: [1, 2, 3])
+
+    assert (measured.part1, measured.part2) == (3, 6)
+    assert set(measured.timings) == {"setup", "part1", "part2"}
+
+
+def test_measure_single_part():
+    measured = result.measure(part2=lambda: "b")
+
+    assert measured.part1 is None
+    assert measured.part2 == "b"
+
+
+def test_measure_memory_only_while_tracing():
+    assert result.measure(lambda: 1).memory == {}
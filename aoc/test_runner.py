@@ -0,0 +1,67 @@
+import importlib
+
+from . import cache, profiling, runner
+
+
+def test_discover_days():
+    days = runner.discover_days(years=[2015])
+
+    assert runner.Day(2015, 1) in days
+    assert all(day.year == 2015 for day in days)
+    assert days == sorted(days, key=lambda day: day.day)
+
+
+def test_schedule_longest_expected_job_first():
+    days = [runner.Day(2015, 1), runner.Day(2016, 5), runner.Day(2015, 20)]
+
+    assert runner.schedule(days) == [
+        runner.Day(2015, 20),
+        runner.Day(2016, 5),
+        runner.Day(2015, 1),
+    ]
+
+
+def test_run_day():
+    report = runner.run_day(runner.Day(2015, 1))
+
+    assert not report.error
+    assert report.result.part1 == 74
+    assert report.result.part2 == 1795
+    assert report.wall_time > 0
+
+
+def test_run_day_closes_cache_on_error(tmp_path, monkeypatch):
+    def fail():
+        raise RuntimeError("Failed.")
+
+    closed = []
+    close = cache.AnswerCache.close
+
+    def record_close(answer_cache: cache.AnswerCache):
+        closed.append(answer_cache)
+        close(answer_cache)
+
+    monkeypatch.setattr(importlib.import_module("year2015.day01.solution"), "run", fail)
+    monkeypatch.setattr(cache.AnswerCache, "close", record_close)
+    report = runner.run_day(runner.Day(2015, 1), tmp_path / "answers.sqlite")
+
+    assert report.error == "RuntimeError: Failed."
+    assert len(closed) == 1
+
+
+def test_run_day_profile(tmp_path, monkeypatch):
+    monkeypatch.setitem(profiling.HOT_FUNCTIONS, "2015/day01", ("find_floor",))
+    report = runner.run_day(runner.Day(2015, 1), profile_dir=tmp_path)
+
+    assert not report.error
+    assert report.result.part1 == 74
+    assert "find_floor" in report.hot_functions
+    assert (tmp_path / "2015_day01.folded").exists()
+
+
+def test_run_day_memory_budget():
+    report = runner.run_day(runner.Day(2015, 17), memory_budget=0.01)
+
+    assert report.error.startswith("MemoryBudgetExceeded")
+    assert report.result.part1 == 1638
+    assert set(report.result.memory) == {"setup", "part1", "part2"}
@@ -0,0 +1,24 @@
+import pytest
+from . import scaffold
+
+
+def test_scaffold_day(tmp_path):
+    day_path = scaffold.scaffold_day(2017, 3, tmp_path)
+
+    assert day_path == tmp_path / "year2017" / "day03"
+    assert (tmp_path / "year2017" / "__init__.py").exists()
+    assert {path.name for path in day_path.iterdir()} == {
+        "__init__.py",
+        "benchmark_solution.py",
+        "input.txt",
+        "solution.py",
+        "test_solution.py",
+    }
+    assert "def run(" in (day_path / "solution.py").read_text()
+
+
+def test_scaffold_day_exists(tmp_path):
+    scaffold.scaffold_day(2017, 3, tmp_path)
+
+    with pytest.raises(FileExistsError):
+        scaffold.scaffold_day(2017, 3, tmp_path)
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from typing import Final
+
+import pytest
+from . import runner
+
+# Summed import time in seconds of the runner and all solution modules,
+# about twice the time measured on an idle machine.
+STARTUP_BUDGET: Final[float] = 0.3
+# The fastest of several runs is the least disturbed by the machine's load.
+N_RUNS: Final[int] = 5
+
+
+def measure_import_time(modules: list[str], n_runs: int = N_RUNS) -> float:
+    import_times = []
+    for _ in range(n_runs):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+            cwd=runner.ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        import_time = 0
+        for line in process.stderr.splitlines():
+            _, cumulative_time, module = line.removeprefix("import time:").split("|")
+            if cumulative_time.strip().isdigit() and not module[1:].startswith(" "):
+                import_time += int(cumulative_time)  # only top-level imports
+        import_times.append(import_time / 1e6)
+
+    return min(import_times)
+
+
+@pytest.mark.timing
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="year2016.day03 requires itertools.batched"
+)
+def test_startup_budget():
+    modules = ["aoc.runner"] + [day.module for day in runner.discover_days()]
+
+    assert measure_import_time(modules) < STARTUP_BUDGET
+
+
+def test_measure_import_time():
+    assert 0 < measure_import_time(["aoc.runner"]) < STARTUP_BUDGET
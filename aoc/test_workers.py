@@ -0,0 +1,18 @@
+import os
+
+import pytest
+from . import workers
+
+
+def test_default_workers(monkeypatch):
+    monkeypatch.setenv(workers.WORKERS_VARIABLE, "")
+
+    assert workers.default_workers() == (os.cpu_count() or 1)
+
+
+@pytest.mark.parametrize("budget, expected", [(3, 3), (0, 1)])
+def test_set_worker_budget(budget: int, expected: int, monkeypatch):
+    monkeypatch.setenv(workers.WORKERS_VARIABLE, "")  # restored after the test
+    workers.set_worker_budget(budget)
+
+    assert workers.default_workers() == expected
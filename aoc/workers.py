@@ -0,0 +1,25 @@
+"""
+Share the cores between the runner and the process pools of the solutions.
+
+Some solutions start a process pool of their own (e.g., to mine MD5 hashes).
+The runner already runs the days in parallel, it hands each of its workers
+an equal share of the cores in the `AOC_WORKERS` environment variable,
+such that the pools of the days don't oversubscribe the machine.
+"""
+import os
+from typing import Final
+
+WORKERS_VARIABLE: Final[str] = "AOC_WORKERS"
+
+
+def default_workers() -> int:
+    """Size of a solution's process pool, if the caller doesn't set one."""
+
+    if workers := os.environ.get(WORKERS_VARIABLE):
+        return max(int(workers), 1)
+
+    return os.cpu_count() or 1
+
+
+def set_worker_budget(workers: int):
+    os.environ[WORKERS_VARIABLE] = str(max(workers, 1))
@@ -0,0 +1,109 @@
+from typing import Callable, Optional
+
+import pytest
+
+from aoc import benchmark as bench
+
+MEASUREMENTS = pytest.StashKey[dict[str, tuple[float, Optional[float]]]]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=3,
+        help="Number of timed runs per benchmark, the fastest one counts.",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=20.0,
+        help="Allowed slowdown relative to the baseline in percent.",
+    )
+    group.addoption(
+        "--benchmark-baselines",
+        default=str(bench.BASELINES_PATH),
+        help="JSON file with the baseline timings.",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        help="Store the timings as new baselines instead of checking them.",
+    )
+    group.addoption(
+        "--run-timing",
+        action="store_true",
+        help="Run the wall-clock tests marked with `timing` as well.",
+    )
+
+
+def pytest_configure(config):
+    config.stash[MEASUREMENTS] = {}
+    config.addinivalue_line(
+        "markers", "timing: wall-clock test, only run with --run-timing"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("run_timing"):
+        return
+
+    skip_timing = pytest.mark.skip(reason="wall-clock test, run with --run-timing")
+    for item in items:
+        if "timing" in item.keywords:
+            item.add_marker(skip_timing)
+
+
+@pytest.fixture(scope="session")
+def benchmark_baselines(request) -> dict[str, float]:
+    return bench.load_baselines(request.config.getoption("benchmark_baselines"))
+
+
+@pytest.fixture
+def benchmark(request, benchmark_baselines) -> Callable:
+    config = request.config
+    name = f"{request.node.path.relative_to(bench.ROOT)}::{request.node.name}"
+
+    def run_benchmark(function: Callable, *args, rounds: Optional[int] = None):
+        result, seconds = bench.time_function(
+            function, *args, rounds=rounds or config.getoption("benchmark_rounds")
+        )
+        baseline = benchmark_baselines.get(name)
+        config.stash[MEASUREMENTS][name] = (seconds, baseline)
+
+        if not config.getoption("benchmark_save"):
+            regression = bench.check_regression(
+                seconds, baseline, config.getoption("benchmark_threshold")
+            )
+            if regression:
+                pytest.fail(regression)
+
+        return result
+
+    return run_benchmark
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    measurements = config.stash[MEASUREMENTS]
+    if not (measurements and config.getoption("benchmark_save")):
+        return
+
+    path = config.getoption("benchmark_baselines")
+    baselines = bench.load_baselines(path)
+    baselines.update({name: seconds for name, (seconds, _) in measurements.items()})
+    bench.save_baselines(baselines, path)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    measurements = config.stash[MEASUREMENTS]
+    if not measurements:
+        return
+
+    terminalreporter.section("benchmarks")
+    for name, (seconds, baseline) in sorted(measurements.items()):
+        line = f"{seconds:10.4f}s  {name}"
+        if baseline:
+            line += f" ({bench.compute_slowdown(seconds, baseline):+.1f}%)"
+        terminalreporter.write_line(line)
@@ -4,22 +4,33 @@
 
 """
 from pathlib import Path
+from typing import Iterator
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
 
-def parse_input(input_path: str) -> str:
-    return Path(input_path).read_text()
 
+def parse_input(input_path: str) -> Iterator[str]:
+    yield from iter_lines(input_path)
 
-def find_bar(foo: str) -> int:
+
+def find_bar(foo: Iterator[str]) -> int:
     return 42
 
 
 def solve_part1(input_path: str):
-    print(f"Part 1:\n...\n")
+    print(f"Part 1:\n{find_bar(parse_input(input_path))}\n")
 
 
 def solve_part2(input_path: str):
-    print(f"Part 2:\n...\n")
+    print(f"Part 2:\n{find_bar(parse_input(input_path))}\n")
+
+
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda: find_bar(parse_input(input_path)),
+        lambda: find_bar(parse_input(input_path)),
+    )
 
 
 if __name__ == "__main__":
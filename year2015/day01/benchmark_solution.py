@@ -0,0 +1,36 @@
+from pathlib import Path
+from . import solution
+from aoc.generators import write_input
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_find_floor(benchmark):
+    with solution.parse_input(INPUT_PATH) as directions:
+        benchmark(solution.find_floor, directions)
+
+
+def test_find_basement_entrance_direction(benchmark):
+    with solution.parse_input(INPUT_PATH) as directions:
+        benchmark(solution.find_basement_entrance_direction, directions)
+
+
+def test_find_floor_large_input(benchmark, tmp_path):
+    input_path = write_input(tmp_path / "input.txt", 2015, 1, 10**6)
+    with solution.parse_input(str(input_path)) as directions:
+        benchmark(solution.find_floor, directions)
+
+
+def test_find_basement_entrance_direction_large_input(benchmark, tmp_path):
+    input_path = write_input(
+        tmp_path / "input.txt", 2015, 1, 10**6, basement_position=10**6 - 1
+    )
+    with solution.parse_input(str(input_path)) as directions:
+        benchmark(solution.find_basement_entrance_direction, directions)
+
+
+def test_track_floor_parallel_large_input(benchmark, tmp_path):
+    input_path = write_input(
+        tmp_path / "input.txt", 2015, 1, 10**7, basement_position=10**7 - 1
+    )
+    benchmark(solution.track_floor_parallel, str(input_path), rounds=1)
@@ -1,3 +1,5 @@
+from itertools import accumulate
+
 import pytest
 from . import solution
 
@@ -26,3 +28,51 @@ def test_find_floor(directions: str, floor: int):
 )
 def test_find_basement_entrance_direction(directions: str, position: int):
     assert solution.find_basement_entrance_direction(directions) == position
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1 << 16])
+@pytest.mark.parametrize(
+    "directions, floor, position",
+    [
+        ("(()))(", 0, 5),
+        ("((((((((((" + ")" * 11 + "(\n", 0, 21),
+        ("\n)", -1, 2),
+    ],
+)
+def test_chunks(
+    directions: str, floor: int, position: int, chunk_size: int, monkeypatch
+):
+    monkeypatch.setattr(solution, "CHUNK_SIZE", chunk_size)
+
+    assert solution.find_floor(directions) == floor
+    assert solution.find_basement_entrance_direction(directions) == position
+
+
+@pytest.mark.parametrize("chunk_sizes", [[6], [1, 1, 1, 1, 1, 1], [4, 2], [5, 1]])
+def test_track_floor(chunk_sizes: list[int]):
+    directions = b"(()))("
+    ends = list(accumulate(chunk_sizes))
+    chunks = [directions[end - size : end] for size, end in zip(chunk_sizes, ends)]
+    tracker = solution.track_floor(chunks)
+
+    assert tracker == solution.FloorTracker(
+        floor=0, lowest_floor=-1, basement_entrance_direction=5, n_directions=6
+    )
+
+
+def test_track_floor_resume():
+    tracker = solution.track_floor([b"(()"])
+    checkpoint = tracker.checkpoint()
+    resumed = solution.track_floor([b"))("], solution.FloorTracker.resume(checkpoint))
+
+    assert resumed == solution.track_floor([b"(()))("])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+@pytest.mark.parametrize("directions", ["(()))(", "((()", "", ")\n"])
+def test_track_floor_parallel(directions: str, chunk_size: int, tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(directions)
+    tracker = solution.track_floor_parallel(str(input_path), 2, chunk_size)
+
+    assert tracker == solution.track_floor([directions])
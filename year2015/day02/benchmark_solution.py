@@ -0,0 +1,41 @@
+from pathlib import Path
+from . import solution
+from aoc.generators import write_input
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_compute_wrapping_paper_area(benchmark):
+    benchmark(
+        lambda: sum(
+            map(solution.compute_wrapping_paper_area, solution.parse_input(INPUT_PATH))
+        )
+    )
+
+
+def test_compute_ribbon_length(benchmark):
+    benchmark(
+        lambda: sum(
+            map(solution.compute_ribbon_length, solution.parse_input(INPUT_PATH))
+        )
+    )
+
+
+def test_parse_presents(benchmark):
+    benchmark(solution.parse_presents, INPUT_PATH)
+
+
+def test_compute_totals_large_input(benchmark, tmp_path):
+    input_path = write_input(tmp_path / "input.txt", 2015, 2, 10**6)
+    presents = solution.parse_presents(str(input_path))
+    benchmark(
+        lambda: (
+            solution.compute_total_wrapping_paper_area(presents),
+            solution.compute_total_ribbon_length(presents),
+        )
+    )
+
+
+def test_compute_order_large_input(benchmark, tmp_path):
+    input_path = write_input(tmp_path / "input.txt", 2015, 2, 10**6)
+    benchmark(solution.compute_order, str(input_path), rounds=1)
@@ -26,3 +26,29 @@ def test_compute_wrapping_paper_area(
 )
 def test_compute_ribbon_length(present_dimensions: list[int], ribbon_length: int):
     assert solution.compute_ribbon_length(present_dimensions) == ribbon_length
+
+
+def test_parse_presents(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("2x3x4\n10x1x1\n")
+    presents = solution.parse_presents(str(input_path))
+
+    assert list(presents.shortest) == [2, 1]
+    assert list(presents.middle) == [3, 1]
+    assert list(presents.longest) == [4, 10]
+    assert solution.compute_total_wrapping_paper_area(presents) == 58 + 43
+    assert solution.compute_total_ribbon_length(presents) == 34 + 14
+
+
+def test_compute_ribbon_length_keeps_dimensions():
+    present_dimensions = [2, 3, 4]
+    solution.compute_ribbon_length(present_dimensions)
+
+    assert present_dimensions == [2, 3, 4]
+
+
+def test_compute_order(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("2x3x4\n10x1x1\n")
+
+    assert solution.compute_order(str(input_path)) == (58 + 43, 34 + 14)
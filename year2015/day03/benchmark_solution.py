@@ -0,0 +1,27 @@
+from pathlib import Path
+from . import solution
+from aoc.generators import write_input
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_track_visited_houses(benchmark):
+    with solution.parse_input(INPUT_PATH) as directions:
+        benchmark(solution.track_visited_houses_packed, directions)
+
+
+def test_track_visited_houses_robosanta(benchmark):
+    with solution.parse_input(INPUT_PATH) as directions:
+        benchmark(solution.track_visited_houses_robosanta_packed, directions)
+
+
+def test_track_visited_houses_large_input(benchmark, tmp_path):
+    input_path = write_input(tmp_path / "input.txt", 2015, 3, 10**6)
+    with solution.parse_input(str(input_path)) as directions:
+        benchmark(solution.track_visited_houses_packed, directions, rounds=1)
+
+
+def test_track_visited_houses_agents_large_input(benchmark, tmp_path):
+    input_path = write_input(tmp_path / "input.txt", 2015, 3, 10**6)
+    with solution.parse_input(str(input_path)) as directions:
+        benchmark(solution.track_visited_houses_agents_packed, directions, 64, rounds=1)
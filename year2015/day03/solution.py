@@ -35,69 +35,90 @@ For example:
 --- Notes ---
 
 """
+from contextlib import AbstractContextManager
+from itertools import accumulate
 from pathlib import Path
+from typing import Final, Iterator
 
+from aoc.inputs import Data, as_bytes, map_input
+from aoc.result import Result, measure
 
-def parse_input(input_path: str) -> str:
-    return Path(input_path).read_text()
 
+def parse_input(input_path: str) -> AbstractContextManager[Data]:
+    return map_input(input_path)
 
-def track_visited_houses(directions: str) -> set[tuple[int, ...]]:
-    current_location = {"x": 0, "y": 0}
-    visited_houses = set([tuple([0, 0])])
 
-    for direction in directions:
-        match direction:
-            case "^":
-                current_location["y"] += 1
-            case "v":
-                current_location["y"] -= 1
-            case ">":
-                current_location["x"] += 1
-            case "<":
-                current_location["x"] -= 1
-        visited_houses.add(tuple(current_location.values()))
+# Houses are packed into single ints, x * 2**32 + y, such that a move is
+# an addition and tracking a path is `accumulate` over moves, all in C.
+# The packing is unique for paths of fewer than 2**31 directions.
+Y_RANGE: Final[int] = 1 << 32
+MOVES: Final[tuple[int, ...]] = tuple(
+    {ord("^"): 1, ord("v"): -1, ord(">"): Y_RANGE, ord("<"): -Y_RANGE}.get(byte, 0)
+    for byte in range(256)
+)
 
-    return visited_houses
 
+def unpack_house(house: int) -> tuple[int, int]:
+    y = (house + Y_RANGE // 2) % Y_RANGE - Y_RANGE // 2
 
-def track_visited_houses_robosanta(directions: str) -> set[tuple[int, ...]]:
-    current_location_santa = {"x": 0, "y": 0}
-    current_location_robosanta = {"x": 0, "y": 0}
-    visited_houses = set([tuple([0, 0])])
+    return (house - y) // Y_RANGE, y
 
-    for i, direction in enumerate(directions):
-        current_location = (
-            current_location_santa if i % 2 == 0 else current_location_robosanta
-        )
-        match direction:
-            case "^":
-                current_location["y"] += 1
-            case "v":
-                current_location["y"] -= 1
-            case ">":
-                current_location["x"] += 1
-            case "<":
-                current_location["x"] -= 1
-        visited_houses.add(tuple(current_location.values()))
+
+def trace_path(directions: Data) -> Iterator[int]:
+    return accumulate(map(MOVES.__getitem__, as_bytes(directions)), initial=0)
+
+
+def track_visited_houses_packed(directions: Data) -> set[int]:
+    return set(trace_path(directions))
+
+
+def track_visited_houses(directions: Data) -> set[tuple[int, ...]]:
+    return set(map(unpack_house, track_visited_houses_packed(directions)))
+
+
+def track_visited_houses_agents_packed(directions: Data, n_agents: int) -> set[int]:
+    """Agents take turns: agent k follows every `n_agents`-th direction from the k-th.
+
+    All agents start at the same house.
+    """
+    directions = as_bytes(directions)
+    visited_houses: set[int] = set()
+    for agent in range(n_agents):
+        visited_houses.update(trace_path(directions[agent::n_agents]))
 
     return visited_houses
 
 
+def track_visited_houses_robosanta_packed(directions: Data) -> set[int]:
+    return track_visited_houses_agents_packed(directions, 2)
+
+
+def track_visited_houses_robosanta(directions: Data) -> set[tuple[int, ...]]:
+    return set(map(unpack_house, track_visited_houses_robosanta_packed(directions)))
+
+
 def solve_part1(input_path: str):
-    directions = parse_input(input_path)
-    visited_houses = track_visited_houses(directions)
+    with parse_input(input_path) as directions:
+        visited_houses = track_visited_houses_packed(directions)
 
     print(f"Part 1:\n{len(visited_houses)} received at least one present.\n")
 
 
 def solve_part2(input_path: str):
-    directions = parse_input(input_path)
-    visited_houses = track_visited_houses_robosanta(directions)
+    with parse_input(input_path) as directions:
+        visited_houses = track_visited_houses_robosanta_packed(directions)
 
     print(f"Part 2:\n{len(visited_houses)} received at least one present.\n")
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    with parse_input(input_path) as directions:
+        return measure(
+            lambda: len(track_visited_houses_packed(directions)),
+            lambda: len(track_visited_houses_robosanta_packed(directions)),
+        )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
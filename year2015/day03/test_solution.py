@@ -41,3 +41,45 @@ def test_track_visited_houses_robosanta(
     directions: str, visited_houses: set[tuple[int, int]]
 ):
     assert solution.track_visited_houses_robosanta(directions) == visited_houses
+
+
+@pytest.mark.parametrize(
+    "house", [(0, 0), (-5, 3), (3, -5), (-7, -9), (2**30, -(2**30))]
+)
+def test_unpack_house(house: tuple[int, int]):
+    x, y = house
+
+    assert solution.unpack_house(x * solution.Y_RANGE + y) == house
+
+
+@pytest.mark.parametrize(
+    "directions, n_visited_houses, n_visited_houses_robosanta",
+    [("^v", 2, 3), ("^>v<", 4, 3), ("^v^v^v^v^v", 2, 11), ("<<\n>>", 3, 2)],
+)
+def test_track_visited_houses_packed(
+    directions: str, n_visited_houses: int, n_visited_houses_robosanta: int
+):
+    assert len(solution.track_visited_houses_packed(directions)) == n_visited_houses
+    assert (
+        len(solution.track_visited_houses_robosanta_packed(directions))
+        == n_visited_houses_robosanta
+    )
+
+
+@pytest.mark.parametrize(
+    "directions, n_agents, n_visited_houses",
+    [
+        ("^>v<", 1, 4),
+        ("^v^v^v^v^v", 2, 11),
+        ("^>v<", 4, 5),
+        ("^^>>vv", 3, 5),
+        ("", 3, 1),
+    ],
+)
+def test_track_visited_houses_agents_packed(
+    directions: str, n_agents: int, n_visited_houses: int
+):
+    assert (
+        len(solution.track_visited_houses_agents_packed(directions, n_agents))
+        == n_visited_houses
+    )
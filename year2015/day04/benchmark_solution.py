@@ -0,0 +1,5 @@
+from . import solution
+
+
+def test_solve(benchmark):
+    benchmark(solution.solve, "bgvyzdsv", "00000", rounds=1)
@@ -21,22 +21,43 @@ Now find one that starts with six zeroes.
 Find the salt that makes the hash have at least five leading zeros.
 
 """
-import hashlib
 
+from typing import Optional
 
-def solve(secret_key: str, prefix: str) -> int:
-    salt = 0
-    result = "0"
-    while not result.startswith(prefix):
-        salt += 1
-        hash_function = hashlib.md5()
-        hash_function.update(bytes(secret_key, "utf-8"))
-        hash_function.update(bytes(str(salt), "utf-8"))
-        result = hash_function.hexdigest()
+from aoc.md5 import CHECKPOINT_PATH, MiningCheckpoints, mine
+from aoc.result import Result, measure
+
+
+def solve(
+    secret_key: str, prefix: str, checkpoints: Optional[MiningCheckpoints] = None
+) -> int:
+    """The prefix consists of zeros. Searches resume from `checkpoints`, if given."""
+
+    if prefix.strip("0"):
+        raise ValueError(f"Expected a prefix of zeros, got {prefix!r}.")
+    if not prefix:  # every hash starts with an empty prefix
+        return 1
+    n_zeros = len(prefix)
+    hits = (
+        mine(secret_key, n_zeros, start=1)
+        if checkpoints is None
+        else checkpoints.mine(secret_key, n_zeros, start=1)
+    )
+    salt, _ = next(hits)
+    hits.close()
 
     return salt
 
 
+def run(secret_key: str = "bgvyzdsv") -> Result:
+    return measure(
+        lambda: solve(secret_key, "00000"),
+        lambda: solve(secret_key, "000000"),
+    )
+
+
 if __name__ == "__main__":
-    print(f"Part 1:\nThe salt is {solve('bgvyzdsv', '00000')}!\n")
-    print(f"Part 2:\nThe salt is {solve('bgvyzdsv', '000000')}!\n")
+    checkpoints = MiningCheckpoints(CHECKPOINT_PATH)
+    print(f"Part 1:\nThe salt is {solve('bgvyzdsv', '00000', checkpoints)}!\n")
+    print(f"Part 2:\nThe salt is {solve('bgvyzdsv', '000000', checkpoints)}!\n")
+    checkpoints.close()
@@ -1,4 +1,5 @@
 import pytest
+from aoc.md5 import MiningCheckpoints
 from . import solution
 
 
@@ -11,3 +12,23 @@ from . import solution
 )
 def test_solve_part1(secret_key: str, salt: int):
     assert solution.solve(secret_key, "00000") == salt
+
+
+def test_solve_resumes_from_checkpoints(tmp_path):
+    checkpoints = MiningCheckpoints(tmp_path / "checkpoints.sqlite")
+
+    assert solution.solve("abcdef", "0000", checkpoints) == solution.solve(
+        "abcdef", "0000"
+    )
+    assert solution.solve("abcdef", "00000", checkpoints) == 609043
+    assert checkpoints.get_stop("abcdef", 5, 1) > 609043
+    checkpoints.close()
+
+
+def test_solve_rejects_other_prefixes():
+    with pytest.raises(ValueError):
+        solution.solve("abcdef", "00a")
+
+
+def test_solve_empty_prefix():
+    assert solution.solve("abcdef", "") == 1
@@ -0,0 +1,22 @@
+from pathlib import Path
+from . import solution
+from aoc.generators import write_input
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_count_nice_strings_part1(benchmark):
+    benchmark(solution.count_nice_strings, INPUT_PATH, solution.RULES_PART1)
+
+
+def test_count_nice_strings_part2(benchmark):
+    benchmark(solution.count_nice_strings, INPUT_PATH, solution.RULES_PART2)
+
+
+def test_count_nice_strings_parallel(benchmark):
+    benchmark(solution.count_nice_strings_parallel, INPUT_PATH)
+
+
+def test_count_nice_strings_parallel_large_input(benchmark, tmp_path):
+    input_path = write_input(tmp_path / "input.txt", 2015, 5, 10**6)
+    benchmark(solution.count_nice_strings_parallel, str(input_path), rounds=1)
@@ -39,44 +39,49 @@ How many strings are nice under these new rules?
 Interactive RegEx playground for Python: https://pythex.org
 
 """
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Callable, Iterator
+from typing import Callable, Final, Iterable, Iterator, Optional, Sequence
+import math
 import re
+import time
+
+from aoc.inputs import CHUNK_SIZE, iter_line_blocks, iter_lines, split_lines, view_input
+from aoc.result import Result, measure
+from aoc.workers import default_workers
+
+REPEATED_LETTER: Final[re.Pattern[str]] = re.compile(r"([a-z])\1")
+VOWEL: Final[re.Pattern[str]] = re.compile("[aeiou]")
+FORBIDDEN_SUBSTRING: Final[re.Pattern[str]] = re.compile("ab|cd|pq|xy")
+REPEATED_LETTER_PAIR: Final[re.Pattern[str]] = re.compile(r"([a-z]{2})[a-z]*\1")
+SEPARATED_REPEATED_LETTER: Final[re.Pattern[str]] = re.compile(r"([a-z])[a-z]\1")
+SAMPLE_SIZE: Final[int] = 1000
+CALIBRATION_INTERVAL: Final[int] = 1 << 16
+# Bounds the work lost in a straggling chunk, see `count_nice_strings_parallel`.
+MAX_PARALLEL_CHUNK_SIZE: Final[int] = 1 << 24
 
 
 def string_contains_repeated_letter(string: str) -> bool:
-    match = re.compile(r"([a-z])\1{1,}").search(string)
-    if not match:
-        return False
-    return True
+    return REPEATED_LETTER.search(string) is not None
 
 
 def string_contains_vowels(string: str) -> bool:
-    match = re.findall("[aeiou]", string)
-    if len(match) < 3:
-        return False
-    return True
+    return len(VOWEL.findall(string)) >= 3
 
 
 def string_free_of_forbidden_substrings(string: str) -> bool:
-    match = [substring in string for substring in ["ab", "cd", "pq", "xy"]]
-    if any(match):
-        return False
-    return True
+    return FORBIDDEN_SUBSTRING.search(string) is None
 
 
 def string_contains_repeated_letter_pair(string: str) -> bool:
-    match = re.compile(r"([a-z]{2})[a-z]*\1").search(string)
-    if not match:
-        return False
-    return True
+    return REPEATED_LETTER_PAIR.search(string) is not None
 
 
 def string_contains_separated_repeated_letter(string: str) -> bool:
-    match = re.compile(r"([a-z]{1})[a-z]{1}\1").search(string)
-    if not match:
-        return False
-    return True
+    return SEPARATED_REPEATED_LETTER.search(string) is not None
 
 
 RULES_PART1 = (
@@ -90,6 +95,16 @@ RULES_PART2 = (
     string_contains_separated_repeated_letter,
 )
 
+# All rules of a set combined into one pattern, which matches at the start of
+# every nice line in a block of lines. Blocks are classified by a single regex
+# call instead of one call per line and rule.
+NICE_LINE: Final[dict[tuple[Callable[[str], bool], ...], re.Pattern[bytes]]] = {
+    RULES_PART1: re.compile(
+        rb"^(?!.*(?:ab|cd|pq|xy))(?=.*([a-z])\1)(?:[^aeiou\n]*[aeiou]){3}", re.M
+    ),
+    RULES_PART2: re.compile(rb"^(?=.*([a-z])[a-z]\1)(?=.*([a-z]{2}).*\2)", re.M),
+}
+
 
 def string_is_nice(string: str, rules: tuple[Callable[[str], bool], ...]) -> bool:
     if all(rule(string) for rule in rules):
@@ -98,30 +113,240 @@ def string_is_nice(string: str, rules: tuple[Callable[[str], bool], ...]) -> boo
     return False
 
 
+@dataclass
+class RuleStats:
+    n_hits: int = 0  # strings the rule accepted
+    n_misses: int = 0  # strings the rule rejected, the remaining rules are skipped
+    # Calibration, where the rule is timed on every string of the samples.
+    n_sampled: int = 0
+    n_sampled_misses: int = 0
+    seconds: float = 0.0
+
+    @property
+    def cost(self) -> float:
+        return self.seconds / self.n_sampled if self.n_sampled else 0.0
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.n_sampled_misses / self.n_sampled if self.n_sampled else 0.0
+
+    def add(self, other: "RuleStats"):
+        for stat in fields(self):
+            setattr(
+                self, stat.name, getattr(self, stat.name) + getattr(other, stat.name)
+            )
+
+
+class RuleEngine:
+    """Applies rules in the order of their expected cost to reject a string.
+
+    Every `calibration_interval` strings, each rule is timed on a sample of
+    `sample_size` strings, and the rules are reordered by cost over rejection
+    rate. Cheap rules that reject many strings run first, such that the other
+    rules are skipped for most naughty strings.
+    Pass an engine to `count_nice_strings` (or engines to
+    `count_nice_strings_parallel`) to read its `stats` after classifying a file.
+    """
+
+    def __init__(
+        self,
+        rules: tuple[Callable[[str], bool], ...],
+        sample_size: int = SAMPLE_SIZE,
+        calibration_interval: int = CALIBRATION_INTERVAL,
+    ):
+        self.rules = list(rules)
+        self.stats = {rule: RuleStats() for rule in rules}
+        self.sample_size = sample_size
+        self.calibration_interval = calibration_interval
+
+    def calibrate(self, sample: list[str]):
+        for rule in self.rules:
+            start = time.perf_counter()
+            n_accepted = sum(map(rule, sample))
+            stats = self.stats[rule]
+            stats.seconds += time.perf_counter() - start
+            stats.n_sampled += len(sample)
+            stats.n_sampled_misses += len(sample) - n_accepted
+        self.reorder()
+
+    def reorder(self):
+        def expected_cost(rule: Callable[[str], bool]) -> float:
+            stats = self.stats[rule]
+            if not stats.rejection_rate:
+                return math.inf
+            return stats.cost / stats.rejection_rate
+
+        self.rules.sort(key=expected_cost)
+
+    def add_stats(self, stats: dict[Callable[[str], bool], RuleStats]):
+        """Adds the stats of another engine with the same rules, e.g., a worker's."""
+
+        for rule, rule_stats in stats.items():
+            self.stats[rule].add(rule_stats)
+        self.reorder()
+
+    def is_nice(self, string: str) -> bool:
+        for rule in self.rules:
+            if not rule(string):
+                self.stats[rule].n_misses += 1
+                return False
+            self.stats[rule].n_hits += 1
+
+        return True
+
+    def count_nice(self, strings: Iterable[str]) -> int:
+        n_nice_strings = 0
+        strings = iter(strings)
+        while batch := list(islice(strings, self.calibration_interval)):
+            self.calibrate(batch[: self.sample_size])
+            n_nice_strings += sum(map(self.is_nice, batch))
+
+        return n_nice_strings
+
+    def format_stats(self) -> str:
+        return "\n".join(
+            f"{rule.__name__}: {self.stats[rule].n_hits} hits,"
+            f" {self.stats[rule].n_misses} misses,"
+            f" {self.stats[rule].cost * 1e9:.0f}ns per string,"
+            f" rejects {self.stats[rule].rejection_rate:.0%}"
+            for rule in self.rules
+        )
+
+
 def parse_input(input_path: str) -> Iterator[str]:
-    with Path(input_path).open() as file:
-        for line in file:
-            yield line
+    return iter_lines(input_path)
 
 
 def count_nice_strings(
     input_path: str,
     rules: tuple[Callable[[str], bool], ...],
+    engine: Optional[RuleEngine] = None,
 ) -> int:
-    n_nice_strings = 0
-    for line in parse_input(input_path):
-        if string_is_nice(line, rules):
-            n_nice_strings += 1
+    """With an `engine` for the rules, it classifies the lines and collects stats.
+
+    Otherwise, rule sets with a combined pattern (see `NICE_LINE`) are matched
+    a block at a time, and the others are classified by a new engine.
+    """
+    if engine is not None:
+        if set(engine.rules) != set(rules):
+            raise ValueError("The engine applies other rules.")
+        return engine.count_nice(parse_input(input_path))
+
+    if rules in NICE_LINE:
+        nice_line = NICE_LINE[rules]
+        return sum(
+            len(nice_line.findall(block)) for block in iter_line_blocks(input_path)
+        )
+
+    return RuleEngine(rules).count_nice(parse_input(input_path))
+
+
+def _count_nice_lines(
+    input_path: str,
+    start: int,
+    stop: int,
+    rule_sets: tuple[tuple[Callable[[str], bool], ...], ...],
+    engines: Sequence[Optional[RuleEngine]],
+) -> list[tuple[int, dict[Callable[[str], bool], RuleStats]]]:
+    """Counts and the stats of the engines' copies, which are empty without one."""
+
+    with view_input(input_path) as view, view[start:stop] as chunk:
+        return _count_nice_lines_in_chunk(chunk, rule_sets, engines)
+
+
+def _count_nice_lines_in_chunk(
+    chunk: memoryview,
+    rule_sets: tuple[tuple[Callable[[str], bool], ...], ...],
+    engines: Sequence[Optional[RuleEngine]],
+) -> list[tuple[int, dict[Callable[[str], bool], RuleStats]]]:
+    counts: list[tuple[int, dict[Callable[[str], bool], RuleStats]]] = []
+    for rules, engine in zip(rule_sets, engines):
+        if engine is None and rules in NICE_LINE:
+            counts.append((len(NICE_LINE[rules].findall(chunk)), {}))
+            continue
+        if engine is None:
+            engine = RuleEngine(rules)
+        else:
+            # A fresh copy, the stats of all chunks are added to the engine after.
+            engine = RuleEngine(
+                tuple(engine.rules), engine.sample_size, engine.calibration_interval
+            )
+        lines = bytes(chunk).decode().removesuffix("\n").split("\n") if chunk else []
+        counts.append((engine.count_nice(lines), engine.stats))
+
+    return counts
+
+
+def count_nice_strings_parallel(
+    input_path: str,
+    rule_sets: tuple[tuple[Callable[[str], bool], ...], ...] = (
+        RULES_PART1,
+        RULES_PART2,
+    ),
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    engines: Optional[Sequence[Optional[RuleEngine]]] = None,
+) -> list[int]:
+    """Counts the nice strings for every rule set in a single read of the file.
+
+    The file is split into chunks of whole lines, which are classified by
+    all rule sets at once on `max_workers` cores (all available by default).
+    With a single worker, or if the input fits into a single chunk, the chunks
+    are classified in this process. The `engines`, if given, classify
+    the lines of their rule sets (see `count_nice_strings`), their stats are
+    collected from all chunks.
+    """
+    engines = engines or [None] * len(rule_sets)
+    for rules, engine in zip(rule_sets, engines):
+        if engine is not None and set(engine.rules) != set(rules):
+            raise ValueError("An engine applies other rules.")
+    max_workers = max_workers or default_workers()
+    chunk_size = chunk_size or min(
+        max(CHUNK_SIZE, -(-Path(input_path).stat().st_size // max_workers)),
+        MAX_PARALLEL_CHUNK_SIZE,
+    )
+    chunks = split_lines(input_path, chunk_size)
+    if max_workers == 1 or len(chunks) <= 1:
+        chunk_counts = [
+            _count_nice_lines(input_path, start, stop, rule_sets, engines)
+            for start, stop in chunks or [(0, 0)]
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            chunk_counts = list(
+                executor.map(
+                    _count_nice_lines,
+                    repeat(input_path),
+                    *zip(*chunks),
+                    repeat(rule_sets),
+                    repeat(engines),
+                )
+            )
+
+    n_nice_strings = []
+    for engine, counts in zip(engines, zip(*chunk_counts)):
+        n_nice_strings.append(sum(count for count, _ in counts))
+        if engine is not None:
+            for _, stats in counts:
+                engine.add_stats(stats)
 
     return n_nice_strings
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda counts: counts[0],
+        lambda counts: counts[1],
+        # The pool only pays off on several cores, which hasn't been measured yet.
+        setup=lambda: count_nice_strings_parallel(input_path, max_workers=1),
+    )
+
+
 if __name__ == "__main__":
     input_path = f"{Path(__file__).parent}/input.txt"
-
-    print(
-        f"Part 1:\nSanta, {count_nice_strings(input_path, RULES_PART1)} strings are nice!\n"
-    )
-    print(
-        f"Part 2:\nSanta, {count_nice_strings(input_path, RULES_PART2)} strings are nice!\n"
+    n_nice_strings_part1, n_nice_strings_part2 = count_nice_strings_parallel(
+        input_path, max_workers=1
     )
+
+    print(f"Part 1:\nSanta, {n_nice_strings_part1} strings are nice!\n")
+    print(f"Part 2:\nSanta, {n_nice_strings_part2} strings are nice!\n")
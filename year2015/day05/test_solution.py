@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from . import solution
 
@@ -98,3 +100,112 @@ def test_string_contains_repeated_letter_pair(string: str, nice: bool):
 )
 def test_string_contains_separated(string: str, nice: bool):
     assert solution.string_contains_separated_repeated_letter(string) == nice
+
+
+@pytest.mark.parametrize("rules", [solution.RULES_PART1, solution.RULES_PART2])
+def test_nice_line_pattern_matches_rules(rules, tmp_path):
+    rng = random.Random(0)
+    lines = ["", "aaa", "xxyxx", "aaaa"] + [
+        "".join(rng.choices("abcdepqxy", k=rng.randrange(1, 17))) for _ in range(2000)
+    ]
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("\n".join(lines) + "\n")
+
+    assert solution.count_nice_strings(str(input_path), rules) == sum(
+        solution.string_is_nice(line, rules) for line in lines
+    )
+    # Reordered rules aren't combined into a pattern, they're applied line by line.
+    assert solution.count_nice_strings(
+        str(input_path), rules
+    ) == solution.count_nice_strings(str(input_path), rules[::-1])
+
+
+def test_rule_engine_orders_by_expected_cost():
+    def slow_rule(string: str) -> bool:
+        return sum(ord(letter) for letter in string * 100) >= 0
+
+    def selective_rule(string: str) -> bool:
+        return string.startswith("a")
+
+    engine = solution.RuleEngine((slow_rule, selective_rule), sample_size=10)
+    engine.calibrate(["abc", "bcd", "cde", "def"])
+
+    assert engine.rules == [selective_rule, slow_rule]
+    assert engine.stats[selective_rule].rejection_rate == 0.75
+
+
+@pytest.mark.parametrize("rules", [solution.RULES_PART1, solution.RULES_PART2])
+def test_rule_engine_counts_hits_and_misses(rules):
+    rng = random.Random(0)
+    strings = [
+        "".join(rng.choices("abcdepqxy", k=rng.randrange(1, 17))) for _ in range(500)
+    ]
+    engine = solution.RuleEngine(rules, sample_size=50, calibration_interval=100)
+    n_nice_strings = engine.count_nice(strings)
+
+    assert n_nice_strings == sum(solution.string_is_nice(s, rules) for s in strings)
+    n_naughty_strings = len(strings) - n_nice_strings
+    assert sum(stats.n_misses for stats in engine.stats.values()) == n_naughty_strings
+    assert all(stats.n_sampled == 250 for stats in engine.stats.values())
+
+
+@pytest.mark.parametrize("rules", [solution.RULES_PART1, solution.RULES_PART2])
+def test_count_nice_strings_with_engine(rules, tmp_path):
+    rng = random.Random(0)
+    lines = ["".join(rng.choices("abcdepqxy", k=16)) for _ in range(200)]
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("\n".join(lines))
+    engine = solution.RuleEngine(rules, sample_size=50)
+    n_nice_strings = solution.count_nice_strings(str(input_path), rules, engine)
+
+    assert n_nice_strings == solution.count_nice_strings(str(input_path), rules)
+    assert sum(stats.n_hits for stats in engine.stats.values()) > 0
+    assert all(stats.n_sampled == 50 for stats in engine.stats.values())
+    with pytest.raises(ValueError):
+        solution.count_nice_strings(str(input_path), rules[:1], engine)
+
+
+@pytest.mark.parametrize("chunk_size", [100, 1 << 20])
+def test_count_nice_strings_parallel_with_engines(chunk_size: int, tmp_path):
+    rng = random.Random(0)
+    lines = ["".join(rng.choices("abcdepqxy", k=16)) for _ in range(200)]
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("\n".join(lines))
+    rule_sets = (solution.RULES_PART1, solution.RULES_PART2)
+    engines = [solution.RuleEngine(rules) for rules in rule_sets]
+
+    counts = solution.count_nice_strings_parallel(
+        str(input_path), rule_sets, 2, chunk_size, engines
+    )
+
+    assert counts == [
+        solution.count_nice_strings(str(input_path), rules) for rules in rule_sets
+    ]
+    for n_nice_strings, engine in zip(counts, engines):
+        n_misses = sum(stats.n_misses for stats in engine.stats.values())
+        assert n_misses == len(lines) - n_nice_strings
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+@pytest.mark.parametrize("chunk_size", [1, 100, 1 << 20])
+def test_count_nice_strings_parallel(max_workers: int, chunk_size: int, tmp_path):
+    rng = random.Random(0)
+    lines = ["".join(rng.choices("abcdepqxy", k=16)) for _ in range(200)]
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("\n".join(lines))
+    rule_sets = (
+        solution.RULES_PART1,
+        solution.RULES_PART2,
+        solution.RULES_PART1[::-1],
+    )
+
+    assert solution.count_nice_strings_parallel(
+        str(input_path), rule_sets, max_workers, chunk_size
+    ) == [solution.count_nice_strings(str(input_path), rules) for rules in rule_sets]
+
+
+def test_count_nice_strings_parallel_empty_input(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.touch()
+
+    assert solution.count_nice_strings_parallel(str(input_path)) == [0, 0]
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+
+from . import solution
+from aoc.generators import write_input
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_change_light_state(benchmark):
+    benchmark(solution.count_lit_lights, INPUT_PATH, rounds=1)
+
+
+def test_change_light_brightness(benchmark):
+    benchmark(solution.compute_total_brightness, INPUT_PATH, rounds=1)
+
+
+@pytest.mark.parametrize("n_instructions", [10**3, 10**4])
+def test_count_lit_lights_sparse_huge_grid(n_instructions: int, benchmark, tmp_path):
+    input_path = write_input(
+        tmp_path / "input.txt", 2015, 6, n_instructions, grid_size=10**9
+    )
+    benchmark(solution.count_lit_lights_sparse, str(input_path), rounds=1)
+
+
+@pytest.mark.parametrize("n_instructions", [10**3, 10**4])
+def test_compute_total_brightness_sparse_huge_grid(
+    n_instructions: int, benchmark, tmp_path
+):
+    input_path = write_input(
+        tmp_path / "input.txt", 2015, 6, n_instructions, grid_size=10**9
+    )
+    benchmark(solution.compute_total_brightness_sparse, str(input_path), rounds=1)
@@ -46,26 +46,37 @@ toggle 0,0 through 999,999 would increase the total brightness by 2000000.
 --- Notes ---
 
 """
+
+from array import array
+from collections import defaultdict
 from pathlib import Path
-from itertools import product
-from typing import Generator
+from itertools import accumulate, compress, pairwise, product
+from operator import sub
+from typing import Callable, Final, Generator, Generic, Iterator, TypeVar
+import sys
+
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
+GRID_SIZE: Final[int] = 1000
+TOGGLE: Final[bytes] = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+LANE_TYPECODES: Final[dict[int, str]] = {16: "H", 32: "I", 64: "Q"}
 
 
 def parse_input(
     input_path: str,
 ) -> Generator[tuple[str, tuple[tuple[int, ...], ...]], None, None]:
-    with Path(input_path).open() as file:
-        for line in file:
-            instruction = line.split()
-            if len(instruction) == 5:
-                instruction.pop(0)
-            instruction.remove("through")
-            mode = instruction.pop(0)
-            coordinates = tuple(
-                tuple(int(c) for c in pair.split(",")) for pair in instruction
-            )
+    for line in iter_lines(input_path):
+        instruction = line.split()
+        if len(instruction) == 5:
+            instruction.pop(0)
+        instruction.remove("through")
+        mode = instruction.pop(0)
+        coordinates = tuple(
+            tuple(int(c) for c in pair.split(",")) for pair in instruction
+        )
 
-            yield mode, coordinates
+        yield mode, coordinates
 
 
 def parse_coordinates(coordinates: tuple[tuple[int, ...], ...]) -> tuple[range, ...]:
@@ -115,28 +126,389 @@ def change_light_brightness(
     return light_grid
 
 
-def solve_part1(input_path: str):
-    light_grid = [[False] * 1000 for _ in range(1000)]
+class LightGrid:
+    """Every row is a `bytearray` of 0 (off) and 1 (on).
+
+    An instruction changes a row's range of lights with a single slice assignment
+    instead of changing the lights one by one.
+    """
+
+    def __init__(self, n_rows: int = GRID_SIZE, n_cols: int = GRID_SIZE):
+        self.rows = [bytearray(n_cols) for _ in range(n_rows)]
+
+    def change_light_state(self, mode: str, coordinates: tuple[tuple[int, ...], ...]):
+        rows, cols = parse_coordinates(coordinates)
+        first, stop = cols.start, cols.stop
+        match mode:
+            case "on" | "off":
+                lights = bytes([mode == "on"]) * len(cols)
+                for row in rows:
+                    self.rows[row][first:stop] = lights
+            case "toggle":
+                for row in rows:
+                    light_row = self.rows[row]
+                    light_row[first:stop] = light_row[first:stop].translate(TOGGLE)
+
+    def count_lit_lights(self) -> int:
+        return sum(row.count(1) for row in self.rows)
+
+
+class BrightnessGrid:
+    """Every row is an `int` that packs the brightnesses into lanes of `lane_bits`.
+
+    An instruction changes a row's range of lights with a single addition
+    or subtraction of a mask that has the change in the range's lanes.
+    Turning lights off subtracts 1 only from the lanes that are on: adding
+    `2**(lane_bits - 1) - 1` to a lane sets its top bit if and only if it's on.
+    That requires every brightness to fit into a lane without its top bit,
+    the lanes are widened as the brightness grows.
+    """
+
+    def __init__(
+        self, n_rows: int = GRID_SIZE, n_cols: int = GRID_SIZE, lane_bits: int = 16
+    ):
+        self.n_cols = n_cols
+        self.lane_bits = lane_bits
+        self.rows = [0] * n_rows
+        self.max_brightness = 0  # upper bound, without turning lights off
+        self._ones = self._pack(array(LANE_TYPECODES[lane_bits], [1]) * n_cols)
+
+    def _repeat(self, value: int, cols: range) -> int:
+        """`value` in the lanes of the columns, 0 in all others."""
+
+        in_cols = (1 << (self.lane_bits * cols.stop)) - (
+            1 << (self.lane_bits * cols.start)
+        )
+
+        return value * (self._ones & in_cols)
+
+    def _pack(self, brightnesses: array) -> int:
+        return int.from_bytes(brightnesses.tobytes(), sys.byteorder)
+
+    def _unpack(self, row: int) -> array:
+        return array(
+            LANE_TYPECODES[self.lane_bits],
+            row.to_bytes(self.n_cols * self.lane_bits // 8, sys.byteorder),
+        )
+
+    def _widen(self):
+        if self.lane_bits * 2 not in LANE_TYPECODES:
+            raise OverflowError(f"Brightness exceeds {self.lane_bits - 1} bits.")
+        unpacked = [self._unpack(row) for row in self.rows]
+        self.lane_bits *= 2
+        typecode = LANE_TYPECODES[self.lane_bits]
+        self.rows = [self._pack(array(typecode, row)) for row in unpacked]
+        self._ones = self._pack(array(typecode, [1]) * self.n_cols)
+
+    def change_light_brightness(
+        self, mode: str, coordinates: tuple[tuple[int, ...], ...]
+    ):
+        rows, cols = parse_coordinates(coordinates)
+        match mode:
+            case "on" | "toggle":
+                increment = 1 if mode == "on" else 2
+                self.max_brightness += increment
+                while self.max_brightness >= 1 << (self.lane_bits - 1):
+                    self._widen()
+                mask = self._repeat(increment, cols)
+                for row in rows:
+                    self.rows[row] += mask
+            case "off":
+                top_bit = self.lane_bits - 1
+                ones = self._repeat(1, cols)
+                fill = self._repeat((1 << top_bit) - 1, cols)
+                for row in rows:
+                    brightness = self.rows[row]
+                    self.rows[row] = brightness - (
+                        (brightness + fill) >> top_bit & ones
+                    )
+
+    def brightnesses(self, row: int) -> array:
+        """The brightness of every light in the row, from column 0 on."""
+
+        return self._unpack(self.rows[row])
+
+    def compute_total_brightness(self) -> int:
+        return sum(sum(self._unpack(row)) for row in self.rows)
+
+
+def count_lit_lights(input_path: str) -> int:
+    light_grid = LightGrid()
+    for mode, coordinates in parse_input(input_path):
+        light_grid.change_light_state(mode, coordinates)
+
+    return light_grid.count_lit_lights()
+
+
+def compute_total_brightness(input_path: str) -> int:
+    light_grid = BrightnessGrid()
     for mode, coordinates in parse_input(input_path):
-        change_light_state(mode, coordinates, light_grid)
+        light_grid.change_light_brightness(mode, coordinates)
+
+    return light_grid.compute_total_brightness()
+
+
+Transform = TypeVar("Transform")
+Planes = list[int]
+
+
+class TransformTree(Generic[Transform]):
+    """Composes the transforms of the active instructions, in the order of the input.
+
+    The instructions are split into blocks of `block_size`, the leaves of
+    a segment tree whose nodes hold the composition of their active instructions.
+    Switching an instruction on or off recomposes its block and the block's
+    ancestors only, the root always holds the composition of all active ones.
+    """
+
+    def __init__(
+        self,
+        n_instructions: int,
+        transform: Callable[[int], Transform],
+        compose: Callable[[Transform, Transform], Transform],
+        identity: Transform,
+        block_size: int = 16,
+    ):
+        self.transform = transform
+        self.compose = compose
+        self.identity = identity
+        self.block_size = block_size
+        self.active = [False] * n_instructions
+        n_blocks = max(-(-n_instructions // block_size), 1)
+        self.n_leaves = 1 << (n_blocks - 1).bit_length()
+        self.nodes = [identity] * (2 * self.n_leaves)
+
+    def _compose(self, first: Transform, then: Transform) -> Transform:
+        if first is self.identity:
+            return then
+        if then is self.identity:
+            return first
+
+        return self.compose(first, then)
+
+    def switch(self, instruction: int):
+        self.active[instruction] = not self.active[instruction]
+        start = instruction - instruction % self.block_size
+        stop = min(start + self.block_size, len(self.active))
+        block = self.identity
+        for i in compress(range(start, stop), self.active[start:stop]):
+            block = self._compose(block, self.transform(i))
+
+        node = self.n_leaves + start // self.block_size
+        self.nodes[node] = block
+        while node > 1:
+            node //= 2
+            self.nodes[node] = self._compose(
+                self.nodes[2 * node], self.nodes[2 * node + 1]
+            )
+
+    @property
+    def root(self) -> Transform:
+        return self.nodes[1]
+
+
+def _sign_extend(planes: Planes, n_planes: int) -> Planes:
+    return planes + planes[-1:] * (n_planes - len(planes))
+
+
+def _trim(planes: Planes) -> Planes:
+    while len(planes) > 1 and planes[-1] == planes[-2]:
+        planes.pop()
+
+    return planes
+
+
+def _add_planes(x: Planes, y: Planes, carry: int = 0) -> Planes:
+    """Adds bit-sliced integers, in two's complement with the sign plane last.
+
+    Plane `k` has the bit of a column set if bit `k` of the column's number is set,
+    an addition is a ripple-carry adder on all columns at once.
+    """
+    n_planes = max(len(x), len(y)) + 1
+    total = []
+    for a, b in zip(_sign_extend(x, n_planes), _sign_extend(y, n_planes)):
+        total.append(a ^ b ^ carry)
+        carry = a & b | carry & (a ^ b)
 
-    n_lit_lights = sum(sum(row) for row in light_grid)
+    return _trim(total)
+
+
+def _subtract_planes(x: Planes, y: Planes, ones: int) -> Planes:
+    return _add_planes(x, [plane ^ ones for plane in y], ones)
+
+
+def _max_planes(x: Planes, y: Planes, ones: int) -> Planes:
+    x_less = _subtract_planes(x, y, ones)[-1]
+    n_planes = max(len(x), len(y))
+
+    return _trim(
+        [
+            a ^ (a ^ b) & x_less
+            for a, b in zip(_sign_extend(x, n_planes), _sign_extend(y, n_planes))
+        ]
+    )
+
+
+def _width_bits(col_widths: list[int]) -> list[int]:
+    """Bitsets of the columns whose width has bit `k` set, for every bit `k`."""
+
+    return [
+        int("".join(str(width >> bit & 1) for width in reversed(col_widths)), 2)
+        for bit in range(max(col_widths, default=0).bit_length())
+    ]
+
+
+def _weigh(lights: int, width_bits: list[int]) -> int:
+    """Sum of the widths of the columns in `lights`, by the bits of the widths."""
+
+    return sum(
+        (lights & columns).bit_count() << bit for bit, columns in enumerate(width_bits)
+    )
+
+
+def sweep_rows(
+    instructions: list[tuple[str, tuple[tuple[int, ...], ...]]],
+) -> tuple[list[int], list[range], Iterator[tuple[int, list[int]]]]:
+    """Compresses the grid to the rectangles between the instructions' boundaries.
+
+    Returns the width of every compressed column and the range of compressed
+    columns of every instruction. Yields the height of every compressed row
+    with the instructions whose rows start or stop at it, i.e., that have to be
+    switched on or off.
+    """
+    row_bounds = sorted(
+        {bound for _, ((x0, _), (x1, _)) in instructions for bound in (x0, x1 + 1)}
+    )
+    col_bounds = sorted(
+        {bound for _, ((_, y0), (_, y1)) in instructions for bound in (y0, y1 + 1)}
+    )
+    col_index = {bound: i for i, bound in enumerate(col_bounds)}
+    switches: dict[int, list[int]] = defaultdict(list)
+    cols = []
+    for i, (_, ((x0, y0), (x1, y1))) in enumerate(instructions):
+        switches[x0].append(i)
+        switches[x1 + 1].append(i)
+        cols.append(range(col_index[y0], col_index[y1 + 1]))
+
+    def iter_rows() -> Iterator[tuple[int, list[int]]]:
+        for bound, next_bound in pairwise(row_bounds):
+            yield next_bound - bound, switches[bound]
+
+    return list(map(sub, col_bounds[1:], col_bounds)), cols, iter_rows()
+
+
+def count_lit_lights_sparse(input_path: str) -> int:
+    """Like `count_lit_lights`, on the compressed grid of `sweep_rows`.
+
+    A compressed row is a bitset of lit columns, an instruction turns it into
+    `row & ~cleared ^ flipped`. Such transforms compose into one of the same kind,
+    the `TransformTree` holds the transform of all instructions active in a row.
+    Memory and time depend on the number of instructions instead of the size
+    of the grid.
+    """
+    instructions = list(parse_input(input_path))
+    col_widths, cols, rows = sweep_rows(instructions)
+    width_bits = _width_bits(col_widths)
+
+    def transform(i: int) -> tuple[int, int]:
+        mask = (1 << cols[i].stop) - (1 << cols[i].start)
+        match instructions[i][0]:
+            case "on":
+                return mask, mask
+            case "off":
+                return mask, 0
+            case _:
+                return 0, mask
+
+    def compose(first: tuple[int, int], then: tuple[int, int]) -> tuple[int, int]:
+        return first[0] | then[0], first[1] & ~then[0] ^ then[1]
+
+    light_rows = TransformTree(len(instructions), transform, compose, (0, 0))
+    n_lit_lights = 0
+    for row_height, switches in rows:
+        for i in switches:
+            light_rows.switch(i)
+        _, lit_lights = light_rows.root
+        n_lit_lights += row_height * _weigh(lit_lights, width_bits)
+
+    return n_lit_lights
+
+
+def compute_total_brightness_sparse(input_path: str) -> int:
+    """Like `compute_total_brightness`, on the compressed grid of `sweep_rows`.
+
+    An instruction changes a brightness `v` to `max(v, drop) + change`, where
+    `drop` undoes the clamping at 0 of turning lights off. Those transforms
+    compose as well, with bit-sliced `Planes` of every column's `change` and
+    `drop`. The total changes are the instructions' changes times their areas,
+    only the drops are summed up column by column.
+    """
+    instructions = list(parse_input(input_path))
+    col_widths, cols, rows = sweep_rows(instructions)
+    ones = (1 << len(col_widths)) - 1
+    width_bits = _width_bits(col_widths)
+    col_offsets = [0, *accumulate(col_widths)]
+    changes = [
+        {"on": 1, "off": -1, "toggle": 2}[mode]
+        * (col_offsets[c.stop] - col_offsets[c.start])
+        for (mode, _), c in zip(instructions, cols)
+    ]
+
+    def transform(i: int) -> tuple[Planes, Planes]:
+        mask = (1 << cols[i].stop) - (1 << cols[i].start)
+        match instructions[i][0]:
+            case "on":
+                return [mask, 0], [0]
+            case "off":
+                return [mask], [mask, 0]
+            case _:
+                return [0, mask, 0], [0]
+
+    def compose(
+        first: tuple[Planes, Planes], then: tuple[Planes, Planes]
+    ) -> tuple[Planes, Planes]:
+        (first_change, first_drop), (then_change, then_drop) = first, then
+        return _add_planes(first_change, then_change), _max_planes(
+            first_drop, _subtract_planes(then_drop, first_change, ones), ones
+        )
+
+    light_rows = TransformTree(len(instructions), transform, compose, ([0], [0]))
+    total_change = 0
+    total_brightness = 0
+    for row_height, switches in rows:
+        for i in switches:
+            light_rows.switch(i)
+            total_change += changes[i] if light_rows.active[i] else -changes[i]
+        _, drops = light_rows.root
+        total_drop = sum(
+            _weigh(plane, width_bits) << bit for bit, plane in enumerate(drops)
+        )
+        total_brightness += row_height * (total_change + total_drop)
+
+    return total_brightness
+
+
+def solve_part1(input_path: str):
+    n_lit_lights = count_lit_lights(input_path)
 
     print(f"Part 1:\n{n_lit_lights} lights are lit after the final instruction.\n")
 
 
 def solve_part2(input_path: str):
-    light_grid = [[False] * 1000 for _ in range(1000)]
-    for mode, coordinates in parse_input(input_path):
-        change_light_brightness(mode, coordinates, light_grid)
-
-    total_brightness = sum(sum(row) for row in light_grid)
+    total_brightness = compute_total_brightness(input_path)
 
     print(
         f"Part 2:\nAfter the final instruction, the lights have a total brightness of {total_brightness}.\n"
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda: count_lit_lights(input_path),
+        lambda: compute_total_brightness(input_path),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
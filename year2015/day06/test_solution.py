@@ -1,5 +1,6 @@
 import pytest
 from . import solution
+from aoc.generators import write_input
 
 
 @pytest.fixture
@@ -73,3 +74,79 @@ def test_final_brightness(light_grid_varying_brightness):
         mode, coordinates, light_grid_varying_brightness
     )
     assert sum(sum(row) for row in final_light_grid) == 33
+
+
+def test_light_grid_matches_change_light_state(tmp_path):
+    light_grid = solution.LightGrid(20, 20)
+    reference_grid = [[False] * 20 for _ in range(20)]
+    input_path = write_input(tmp_path / "input.txt", 2015, 6, 200, grid_size=20)
+    for mode, coordinates in solution.parse_input(str(input_path)):
+        light_grid.change_light_state(mode, coordinates)
+        solution.change_light_state(mode, coordinates, reference_grid)
+
+    assert [list(map(bool, row)) for row in light_grid.rows] == reference_grid
+    assert light_grid.count_lit_lights() == sum(sum(row) for row in reference_grid)
+
+
+def test_brightness_grid_matches_change_light_brightness(tmp_path):
+    light_grid = solution.BrightnessGrid(20, 20)
+    reference_grid = [[0] * 20 for _ in range(20)]
+    input_path = write_input(tmp_path / "input.txt", 2015, 6, 200, grid_size=20)
+    for mode, coordinates in solution.parse_input(str(input_path)):
+        light_grid.change_light_brightness(mode, coordinates)
+        solution.change_light_brightness(mode, coordinates, reference_grid)
+
+    assert [list(light_grid.brightnesses(row)) for row in range(20)] == reference_grid
+    assert light_grid.compute_total_brightness() == sum(
+        sum(row) for row in reference_grid
+    )
+
+
+def test_brightness_grid_widens_lanes():
+    light_grid = solution.BrightnessGrid(3, 3)
+    for _ in range(20000):
+        light_grid.change_light_brightness("toggle", ((0, 0), (1, 1)))
+    light_grid.change_light_brightness("off", ((1, 1), (2, 2)))
+
+    assert light_grid.lane_bits == 32
+    assert [list(light_grid.brightnesses(row)) for row in range(3)] == [
+        [40000, 40000, 0],
+        [40000, 39999, 0],
+        [0, 0, 0],
+    ]
+
+
+def test_transform_tree_composes_active_instructions_in_order():
+    tree = solution.TransformTree(
+        40, lambda i: f"{i},", lambda first, then: first + then, "", block_size=4
+    )
+    for i in (30, 3, 17, 4, 39, 17):
+        tree.switch(i)
+
+    assert tree.root == "3,4,30,39,"
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_solvers_match_grids(seed: int, tmp_path):
+    input_path = write_input(tmp_path / "input.txt", 2015, 6, 100, seed, grid_size=50)
+
+    assert solution.count_lit_lights_sparse(
+        str(input_path)
+    ) == solution.count_lit_lights(str(input_path))
+    assert solution.compute_total_brightness_sparse(
+        str(input_path)
+    ) == solution.compute_total_brightness(str(input_path))
+
+
+def test_sparse_solvers_on_huge_grid(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(
+        "turn on 0,0 through 999999999,999999999\n"
+        "toggle 0,0 through 0,999999999\n"
+        "turn off 5,5 through 5,5\n"
+    )
+
+    assert solution.count_lit_lights_sparse(str(input_path)) == 10**18 - 10**9 - 1
+    assert solution.compute_total_brightness_sparse(str(input_path)) == (
+        10**18 + 2 * 10**9 - 1
+    )
@@ -0,0 +1,8 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input_part1.txt"
+
+
+def test_compute_wire_input(benchmark):
+    benchmark(solution.solve, INPUT_PATH)
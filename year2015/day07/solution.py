@@ -66,15 +66,17 @@ from pathlib import Path
 from operator import and_, or_, invert, lshift, rshift
 from collections import namedtuple
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 Operation = namedtuple("Operation", "operands operator")
 
 
 def parse_input(input_path: str) -> str:
     circuit = {}
-    with Path(input_path).open() as file:
-        for instruction in file:
-            operation, wire = instruction.split("->")
-            circuit[wire.strip()] = parse_operation(operation)
+    for instruction in iter_lines(input_path):
+        operation, wire = instruction.split("->")
+        circuit[wire.strip()] = parse_operation(operation)
 
     return circuit
 
@@ -154,6 +156,16 @@ def solve(input_path: str):
     return compute_wire_input("a", circuit)
 
 
+def run(
+    input_path_part1: str = f"{Path(__file__).parent}/input_part1.txt",
+    input_path_part2: str = f"{Path(__file__).parent}/input_part2.txt",
+) -> Result:
+    return measure(
+        lambda: solve(input_path_part1),
+        lambda: solve(input_path_part2),
+    )
+
+
 if __name__ == "__main__":
     input_dir = Path(__file__).parent
     input_path_part1 = f"{input_dir}/input_part1.txt"
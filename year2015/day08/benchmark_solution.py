@@ -0,0 +1,8 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_count_chars(benchmark):
+    benchmark(solution.solve, INPUT_PATH)
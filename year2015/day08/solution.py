@@ -55,13 +55,15 @@ import codecs
 from pathlib import Path
 from collections import namedtuple
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 CharCounts = namedtuple("CharCounts", "n_chars_code n_chars_memory n_chars_encoded")
 
 
 def parse_input(input_path: str) -> str:
-    with Path(input_path).open() as file:
-        for line in file:
-            yield line.strip()
+    for line in iter_lines(input_path):
+        yield line.strip()
 
 
 def count_chars_encoded(line: str) -> int:
@@ -95,6 +97,14 @@ def solve(input_path: str) -> namedtuple:
     return CharCounts(total_n_chars_code, total_n_chars_memory, total_n_chars_encoded)
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda char_counts: char_counts.n_chars_code - char_counts.n_chars_memory,
+        lambda char_counts: char_counts.n_chars_encoded - char_counts.n_chars_code,
+        setup=lambda: solve(input_path),
+    )
+
+
 if __name__ == "__main__":
     char_counts = solve(f"{Path(__file__).parent}/input.txt")
     total_n_chars_part1 = char_counts.n_chars_code - char_counts.n_chars_memory
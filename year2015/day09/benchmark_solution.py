@@ -0,0 +1,9 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_find_extreme_path(benchmark):
+    city_distances = solution.parse_input(INPUT_PATH)
+    benchmark(solution.find_extreme_path, city_distances, float("inf"), min)
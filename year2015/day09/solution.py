@@ -51,18 +51,20 @@ import itertools
 from collections import defaultdict
 from pathlib import Path
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> dict[str, dict[str, int]]:
     city_distances = defaultdict(dict)
 
-    with Path(input_path).open() as file:
-        for line in file:
-            cities, distance = line.split("=")
-            distance = int(distance.strip())
-            city1, city2 = (city.strip() for city in cities.split("to"))
+    for line in iter_lines(input_path):
+        cities, distance = line.split("=")
+        distance = int(distance.strip())
+        city1, city2 = (city.strip() for city in cities.split("to"))
 
-            city_distances[city1].update({city2: distance})
-            city_distances[city2].update({city1: distance})
+        city_distances[city1].update({city2: distance})
+        city_distances[city2].update({city1: distance})
 
     return city_distances
 
@@ -107,6 +109,14 @@ def solve_part2(input_path: str):
     print(f"Part 2:\nSanta, the longest route is {longest_path} long!\n")
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda city_distances: find_extreme_path(city_distances, float("inf"), min),
+        lambda city_distances: find_extreme_path(city_distances, float("0"), max),
+        setup=lambda: parse_input(input_path),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
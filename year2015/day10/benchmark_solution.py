@@ -0,0 +1,5 @@
+from . import solution
+
+
+def test_play_look_and_say(benchmark):
+    benchmark(solution.solve, "1113222113", 50, rounds=1)
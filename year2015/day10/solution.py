@@ -40,6 +40,8 @@ apply this process 50 times. What is the length of the new result?
 """
 from itertools import groupby
 
+from aoc.result import Result, measure
+
 
 def play_look_and_say(sequence: str) -> str:
     final_sequence = ""
@@ -75,6 +77,13 @@ def solve(sequence: str, n_rounds: int) -> int:
     return len(sequence)
 
 
+def run(sequence: str = "1113222113") -> Result:
+    return measure(
+        lambda: solve(sequence, 40),
+        lambda: solve(sequence, 50),
+    )
+
+
 if __name__ == "__main__":
     print(
         f"Part 1:\nAfter 40 iterations, the length of the sequence is {solve('1113222113', 40)}.\n"
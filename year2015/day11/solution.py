@@ -47,6 +47,8 @@ Santa's password expired again. What's the next one?
 import re
 from itertools import pairwise, groupby
 
+from aoc.result import Result, measure
+
 
 def increment_password(password: str) -> str:
     """97 and 122 are Unicode characters 'a' and 'z'."""
@@ -96,6 +98,13 @@ def solve(password: str) -> str:
     return updated_password
 
 
+def run(password: str = "hepxcrrq") -> Result:
+    return measure(
+        lambda: solve(password),
+        lambda: solve(solve(password)),  # Santa's password expires again
+    )
+
+
 if __name__ == "__main__":
     print(f"Part 1:\nSanta, your new password is {solve('hepxcrrq')}!\n")
     print(f"Part 2:\nSanta, your new password is {solve('hepxxyzz')}!\n")
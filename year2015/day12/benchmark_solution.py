@@ -0,0 +1,15 @@
+import json
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_add_numbers(benchmark):
+    document = solution.parse_input(INPUT_PATH)
+    benchmark(solution.add_numbers, document)
+
+
+def test_add_numbers_conditionally(benchmark):
+    document = json.loads(solution.parse_input(INPUT_PATH))
+    benchmark(lambda: sum(solution.add_numbers_conditionally(document)))
@@ -42,6 +42,8 @@ import re
 from pathlib import Path
 from typing import Union, Generator
 
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> str:
     return Path(input_path).read_text()
@@ -81,6 +83,14 @@ def solve_part2(input_path: str):
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda document: add_numbers(document),
+        lambda document: sum(add_numbers_conditionally(json.loads(document))),
+        setup=lambda: parse_input(input_path),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
@@ -0,0 +1,13 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_find_optimal_seating_arrangement(benchmark):
+    happiness_changes = solution.add_indifferent_attendee(
+        solution.parse_input(INPUT_PATH)
+    )
+    benchmark(
+        solution.find_optimal_seating_arrangement, happiness_changes, rounds=1
+    )
@@ -68,19 +68,19 @@ from collections import defaultdict
 from operator import neg
 from itertools import permutations, pairwise
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> dict[str, dict[str, int]]:
     happiness_changes = defaultdict(dict)
 
-    with Path(input_path).open() as file:
-        for line in file:
-            split_line = line.strip().split()
-            change = (
-                neg(int(split_line[3]))
-                if split_line[2] == "lose"
-                else int(split_line[3])
-            )
-            happiness_changes[split_line[0]].update({split_line[-1][:-1]: change})
+    for line in iter_lines(input_path):
+        split_line = line.strip().split()
+        change = (
+            neg(int(split_line[3])) if split_line[2] == "lose" else int(split_line[3])
+        )
+        happiness_changes[split_line[0]].update({split_line[-1][:-1]: change})
 
     return happiness_changes
 
@@ -121,11 +121,20 @@ def solve_part1(input_path: str):
     )
 
 
-def solve_part2(input_path: str):
-    happiness_changes = parse_input(input_path)
+def add_indifferent_attendee(
+    happiness_changes: dict[str, dict[str, int]], name: str = "Jan"
+) -> dict[str, dict[str, int]]:
+    """Returns mutated happiness changes."""
+
     for attendee in list(happiness_changes):
-        happiness_changes["Jan"].update({attendee: 0})
-        happiness_changes[attendee].update({"Jan": 0})
+        happiness_changes[name].update({attendee: 0})
+        happiness_changes[attendee].update({name: 0})
+
+    return happiness_changes
+
+
+def solve_part2(input_path: str):
+    happiness_changes = add_indifferent_attendee(parse_input(input_path))
     max_happiness = find_optimal_seating_arrangement(happiness_changes)
 
     print(
@@ -133,6 +142,15 @@ def solve_part2(input_path: str):
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda: find_optimal_seating_arrangement(parse_input(input_path)),
+        lambda: find_optimal_seating_arrangement(
+            add_indifferent_attendee(parse_input(input_path))
+        ),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
@@ -0,0 +1,9 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_compute_winning_points(benchmark):
+    performance_data = solution.parse_input(INPUT_PATH)
+    benchmark(solution.compute_winning_points, 2503, performance_data)
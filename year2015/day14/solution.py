@@ -59,18 +59,20 @@ after exactly 2503 seconds, how many points does the winning reindeer have?
 """
 from pathlib import Path
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> dict[str, dict[str, int]]:
     reindeer_performance_data = {}
 
-    with Path(input_path).open() as file:
-        for line in file:
-            split_line = line.strip().split()
-            reindeer_performance_data[split_line[0]] = {
-                "go_distance_per_time": int(split_line[3]),
-                "go_time": int(split_line[6]),
-                "rest_time": int(split_line[13]),
-            }
+    for line in iter_lines(input_path):
+        split_line = line.strip().split()
+        reindeer_performance_data[split_line[0]] = {
+            "go_distance_per_time": int(split_line[3]),
+            "go_time": int(split_line[6]),
+            "rest_time": int(split_line[13]),
+        }
 
     return reindeer_performance_data
 
@@ -143,6 +145,14 @@ def solve_part2(input_path: str):
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda performance_data: compute_winning_distance(2503, performance_data),
+        lambda performance_data: compute_winning_points(2503, performance_data),
+        setup=lambda: parse_input(input_path),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
@@ -0,0 +1,16 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_find_max_cookie_score(benchmark):
+    ingredient_properties = solution.parse_input(INPUT_PATH)
+    benchmark(
+        solution.find_max_cookie_score,
+        ingredient_properties,
+        4,
+        100,
+        solution.compute_cookie_score,
+        rounds=1,
+    )
@@ -83,12 +83,14 @@ from math import prod
 from typing import Callable
 import re
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> list[tuple[int, ...]]:
     ingredients = []
-    with Path(input_path).open() as file:
-        for line in file:
-            ingredients.append(tuple(int(i) for i in re.findall(r"-?\d+", line)))
+    for line in iter_lines(input_path):
+        ingredients.append(tuple(int(i) for i in re.findall(r"-?\d+", line)))
 
     return list(zip(*ingredients))
 
@@ -170,5 +172,17 @@ def solve(input_path: str):
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda ingredient_properties: find_max_cookie_score(
+            ingredient_properties, 4, 100, compute_cookie_score
+        ),
+        lambda ingredient_properties: find_max_cookie_score(
+            ingredient_properties, 4, 100, compute_cookie_score_with_calorie_constraint
+        ),
+        setup=lambda: parse_input(input_path),
+    )
+
+
 if __name__ == "__main__":
     solve(f"{Path(__file__).parent}/input.txt")
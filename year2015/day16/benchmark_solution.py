@@ -0,0 +1,8 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_find_aunt(benchmark):
+    benchmark(lambda: solution.find_aunt(solution.parse_input(INPUT_PATH)))
@@ -66,6 +66,9 @@ from typing import Iterator, Callable
 from dataclasses import dataclass
 from operator import eq, gt, lt
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 @dataclass
 class AuntAttributeQuery:
@@ -91,14 +94,12 @@ AUNT_ATTRIBUTE_QUERIES = {
 
 
 def parse_input(input_path: str) -> Iterator[dict[str, int]]:
-    with Path(input_path).open() as file:
-        for line in file:
-            aunt_attributes = dict(
-                [s.strip() for s in segment.split(":")[-2:]]
-                for segment in line.split(",")
-            )
+    for line in iter_lines(input_path):
+        aunt_attributes = dict(
+            [s.strip() for s in segment.split(":")[-2:]] for segment in line.split(",")
+        )
 
-            yield {k: int(v) for k, v in aunt_attributes.items()}
+        yield {k: int(v) for k, v in aunt_attributes.items()}
 
 
 def find_aunt(aunts: Iterator[dict[str, int]]) -> int:
@@ -123,5 +124,9 @@ def solve_part2(input_path: str):
     print(f"Part 2:\nThe gift's from aunt Sue {matching_aunt}.\n")
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(part2=lambda: find_aunt(parse_input(input_path)))
+
+
 if __name__ == "__main__":
     solve_part2(f"{Path(__file__).parent}/input.txt")
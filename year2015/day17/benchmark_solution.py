@@ -0,0 +1,9 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_find_container_combinations(benchmark):
+    containers = solution.parse_input(INPUT_PATH)
+    benchmark(solution.find_container_combinations, containers, 150)
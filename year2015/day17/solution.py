@@ -33,6 +33,8 @@ There were three ways to use that many containers, and so the answer there would
 from pathlib import Path
 from itertools import combinations
 
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> tuple[int, ...]:
     return tuple(int(i) for i in Path(input_path).read_text().splitlines())
@@ -51,6 +53,14 @@ def find_container_combinations(
     return container_combinations
 
 
+def find_minimal_container_combinations(
+    container_combinations: list[tuple[int, ...]]
+) -> list[tuple[int, ...]]:
+    min_n_containers = min(len(c) for c in container_combinations)
+
+    return [c for c in container_combinations if len(c) == min_n_containers]
+
+
 def solve(input_path: str):
     containers = parse_input(input_path)
     container_combinations = find_container_combinations(containers, 150)
@@ -60,14 +70,25 @@ def solve(input_path: str):
         f"Part 1:\nThere are {n_combinations} different container combinations that exactly fit 150 liters.\n"
     )
 
-    min_n_containers = min(len(c) for c in container_combinations)
-    n_combinations = len(
-        [c for c in container_combinations if len(c) == min_n_containers]
+    minimal_container_combinations = find_minimal_container_combinations(
+        container_combinations
     )
+    min_n_containers = len(minimal_container_combinations[0])
+    n_combinations = len(minimal_container_combinations)
     print(
         f"Part 2:\nThere are {n_combinations} different ways to fill {min_n_containers} containers with exactly 150 litres.\n"
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda container_combinations: len(container_combinations),
+        lambda container_combinations: len(
+            find_minimal_container_combinations(container_combinations)
+        ),
+        setup=lambda: find_container_combinations(parse_input(input_path), 150),
+    )
+
+
 if __name__ == "__main__":
     solve(f"{Path(__file__).parent}/input.txt")
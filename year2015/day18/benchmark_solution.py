@@ -0,0 +1,9 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_compute_light_state(benchmark):
+    lights = solution.parse_input(INPUT_PATH)
+    benchmark(solution.animate_lights, lights, 100, rounds=1)
@@ -157,6 +157,8 @@ how many lights are on after 100 steps?
 from pathlib import Path
 from typing import Final
 
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> tuple[bool, ...]:
     with Path(input_path).open() as file:
@@ -266,29 +268,43 @@ def switch_on_grid_corners(
     return tuple(True if i in corners else light for i, light in enumerate(lights))
 
 
-def solve(input_path: str):
+def animate_lights(
+    lights: tuple[bool, ...], n_steps: int, corners_stuck: bool = False
+) -> tuple[bool, ...]:
     LIGHT_NEIGHBORS: Final[tuple[tuple[int, ...], ...]] = map_light_neighbors()
-    n_steps = 100
 
-    lights = parse_input(input_path)
+    if corners_stuck:
+        lights = switch_on_grid_corners(lights)
     for _ in range(n_steps):
         lights = tuple(
             compute_light_state(light, lights, light_neighbors)
             for light, light_neighbors in enumerate(LIGHT_NEIGHBORS)
         )
+        if corners_stuck:
+            lights = switch_on_grid_corners(lights)
+
+    return lights
+
+
+def solve(input_path: str):
+    n_steps = 100
+
+    lights = animate_lights(parse_input(input_path), n_steps)
     print(f"Part 1:\nAfter {n_steps} steps, {sum(lights)} lights are switched on.\n")
 
-    lights = switch_on_grid_corners(parse_input(input_path))
-    for _ in range(n_steps):
-        lights = tuple(
-            compute_light_state(light, lights, light_neighbors)
-            for light, light_neighbors in enumerate(LIGHT_NEIGHBORS)
-        )
-        lights = switch_on_grid_corners(lights)
+    lights = animate_lights(parse_input(input_path), n_steps, corners_stuck=True)
     print(
         f"Part 2:\nAfter {n_steps} steps, {sum(lights)} lights are switched on when the four corners are always in the 'on' state.\n"
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda lights: sum(animate_lights(lights, 100)),
+        lambda lights: sum(animate_lights(lights, 100, corners_stuck=True)),
+        setup=lambda: parse_input(input_path),
+    )
+
+
 if __name__ == "__main__":
     solve(f"{Path(__file__).parent}/input.txt")
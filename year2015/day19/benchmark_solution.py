@@ -0,0 +1,22 @@
+import random
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_find_molecule_children(benchmark):
+    element_replacements, molecule = solution.parse_input_part1(INPUT_PATH)
+    benchmark(
+        lambda: set(solution.find_molecule_children(element_replacements, molecule))
+    )
+
+
+def test_revert_molecule(benchmark):
+    element_replacements, molecule = solution.parse_input_part2(INPUT_PATH)
+
+    def revert_molecule():
+        random.seed(1)  # the search shuffles its queue, fix it for comparable timings
+        return solution.revert_molecule(element_replacements, molecule)
+
+    benchmark(revert_molecule, rounds=1)
@@ -98,6 +98,8 @@ from collections import defaultdict
 from typing import Iterator
 import bisect
 
+from aoc.result import Result, measure
+
 
 def parse_input_part1(input_path: str) -> tuple[dict[str, set[str]], str]:
     replacements: dict = defaultdict(set)
@@ -194,6 +196,13 @@ def solve_part2(input_path: str):
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda: len(set(find_molecule_children(*parse_input_part1(input_path)))),
+        lambda: revert_molecule(*parse_input_part2(input_path)),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
@@ -0,0 +1,10 @@
+from . import solution
+
+
+def test_solve_part1(benchmark):
+    benchmark(
+        solution.solve,
+        36000000,
+        solution.compute_number_of_presents_part1,
+        rounds=1,
+    )
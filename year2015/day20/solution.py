@@ -55,6 +55,8 @@ https://en.wikipedia.org/wiki/Divisor_function
 from math import sqrt
 from typing import Callable
 
+from aoc.result import Result, measure
+
 
 def compute_number_of_presents_part1(house_number: int) -> int:
     number_of_presents = 0
@@ -92,6 +94,13 @@ def solve(n_presents_target: int, compute_number_of_presents: Callable) -> int:
     return house_number
 
 
+def run(n_presents_target: int = 36000000) -> Result:
+    return measure(
+        lambda: solve(n_presents_target, compute_number_of_presents_part1),
+        lambda: solve(n_presents_target, compute_number_of_presents_part2),
+    )
+
+
 if __name__ == "__main__":
     n_presents_target = 36000000
     print(
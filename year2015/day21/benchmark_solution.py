@@ -0,0 +1,5 @@
+from . import solution
+
+
+def test_find_maximum_losing_budget(benchmark):
+    benchmark(solution.find_maximum_losing_budget)
@@ -90,6 +90,8 @@ from functools import reduce
 from operator import add
 from typing import Final, Union
 
+from aoc.result import Result, measure
+
 
 @dataclass
 class Henry:
@@ -172,7 +174,7 @@ def compute_winner(henry: Henry, boss: Boss) -> Union[Henry, Boss]:
             return boss
 
 
-def solve_part1():
+def find_minimum_winning_budget() -> int:
     for item_combination in get_item_combinations():
         if (
             compute_winner(
@@ -183,12 +185,10 @@ def solve_part1():
         ):
             break
 
-    print(
-        f"Part 1:\nHenry can win the fight on a minimum budget of {item_combination.cost} gold.\n"
-    )
+    return item_combination.cost
 
 
-def solve_part2():
+def find_maximum_losing_budget() -> int:
     for item_combination in reversed(get_item_combinations()):
         if (
             compute_winner(
@@ -199,11 +199,25 @@ def solve_part2():
         ):
             break
 
+    return item_combination.cost
+
+
+def solve_part1():
     print(
-        f"Part 2:\nHenry can loose the fight on a maximum budget of {item_combination.cost} gold.\n"
+        f"Part 1:\nHenry can win the fight on a minimum budget of {find_minimum_winning_budget()} gold.\n"
     )
 
 
+def solve_part2():
+    print(
+        f"Part 2:\nHenry can loose the fight on a maximum budget of {find_maximum_losing_budget()} gold.\n"
+    )
+
+
+def run() -> Result:
+    return measure(find_minimum_winning_budget, find_maximum_losing_budget)
+
+
 if __name__ == "__main__":
     solve_part1()
     solve_part2()
@@ -0,0 +1,5 @@
+from . import solution
+
+
+def test_play(benchmark):
+    benchmark(lambda: min(solution.play(solution.start_game())), rounds=1)
@@ -168,6 +168,8 @@ import dataclasses
 import copy
 from typing import TypedDict, Iterator
 
+from aoc.result import Result, measure
+
 
 @dataclasses.dataclass
 class Player:
@@ -328,32 +330,36 @@ def play(game: Game, max_n_spells: int = 10, handicap_henry: int = 0) -> Iterato
         )
 
 
-def solve_part1():
-    game: Game = {
+def start_game() -> Game:
+    return {
         "Henry": Player(hit_points=50, mana=500),
         "Boss": Player(hit_points=58, damage=9),
         "multiturn_spells": [],
         "spell_history": [],
     }
-    winning_budget = min(winning_budget for winning_budget in play(game))
+
+
+def solve_part1():
+    winning_budget = min(winning_budget for winning_budget in play(start_game()))
     print(f"Part 1:\nHenry can win on a minimum budget of {winning_budget} mana.\n")
 
 
 def solve_part2():
-    game: Game = {
-        "Henry": Player(hit_points=50, mana=500),
-        "Boss": Player(hit_points=58, damage=9),
-        "multiturn_spells": [],
-        "spell_history": [],
-    }
     winning_budget = min(
-        winning_budget for winning_budget in play(game, handicap_henry=1)
+        winning_budget for winning_budget in play(start_game(), handicap_henry=1)
     )
     print(
         f"Part 2:\nHandicapped Henry can win on a minimum budget of {winning_budget} mana.\n"
     )
 
 
+def run() -> Result:
+    return measure(
+        lambda: min(play(start_game())),
+        lambda: min(play(start_game(), handicap_henry=1)),
+    )
+
+
 if __name__ == "__main__":
     solve_part1()
     solve_part2()
@@ -0,0 +1,9 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_run_program(benchmark):
+    program = Path(INPUT_PATH).read_text().splitlines()
+    benchmark(lambda: solution.run_program(program, {"a": 1, "b": 0}))
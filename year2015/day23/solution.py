@@ -52,11 +52,14 @@ Which instruction is executed if conditional jump doesn't fire?
 Is the default offset 1?
 """
 from pathlib import Path
-from typing import Final
+from functools import cache
 
-PROGRAM: Final[list[str]] = (
-    Path(__file__).parent.joinpath("input.txt").read_text().splitlines()
-)
+from aoc.result import Result, measure
+
+
+@cache
+def load_program() -> list[str]:
+    return Path(__file__).parent.joinpath("input.txt").read_text().splitlines()
 
 
 def run_program(program: list[str], registers: dict[str, int]) -> dict[str, int]:
@@ -99,7 +102,7 @@ def run_program(program: list[str], registers: dict[str, int]) -> dict[str, int]
 
 def solve_part1():
     initial_registers: dict[str, int] = {"a": 0, "b": 0}
-    final_registers = run_program(PROGRAM, initial_registers)
+    final_registers = run_program(load_program(), initial_registers)
 
     print(
         f"Part 1:\nAfter running the program, register 'b' has the value {final_registers['b']}\n"
@@ -108,13 +111,21 @@ def solve_part1():
 
 def solve_part2():
     initial_registers: dict[str, int] = {"a": 1, "b": 0}
-    final_registers = run_program(PROGRAM, initial_registers)
+    final_registers = run_program(load_program(), initial_registers)
 
     print(
         f"Part 2:\nAfter running the program, register 'b' has the value {final_registers['b']}\n"
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda program: run_program(program, {"a": 0, "b": 0})["b"],
+        lambda program: run_program(program, {"a": 1, "b": 0})["b"],
+        setup=lambda: Path(input_path).read_text().splitlines(),
+    )
+
+
 if __name__ == "__main__":
     solve_part1()
     solve_part2()
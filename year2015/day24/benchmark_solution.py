@@ -0,0 +1,7 @@
+from . import solution
+
+
+def test_find_smallest_quantum_entanglement(benchmark):
+    benchmark(
+        solution.find_smallest_quantum_entanglement, solution.PACKAGE_WEIGHTS, 3
+    )
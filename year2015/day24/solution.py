@@ -89,6 +89,8 @@ from typing import Final
 from itertools import combinations
 from math import prod
 
+from aoc.result import Result, measure
+
 PACKAGE_WEIGHTS: Final[list[int]] = [
     1,
     2,
@@ -155,6 +157,13 @@ def solve_part2():
     )
 
 
+def run(package_weights: list[int] = PACKAGE_WEIGHTS) -> Result:
+    return measure(
+        lambda: find_smallest_quantum_entanglement(package_weights, 3),
+        lambda: find_smallest_quantum_entanglement(package_weights, 4),
+    )
+
+
 if __name__ == "__main__":
     solve_part1()
     solve_part2()
@@ -0,0 +1,5 @@
+from . import solution
+
+
+def test_compute_code(benchmark):
+    benchmark(solution.compute_code, 2981, 3075, rounds=1)
@@ -80,6 +80,8 @@ Otherwise, go to row R-1 and column C+1.
 import os
 import time
 
+from aoc.result import Result, measure
+
 
 def print_pattern(pattern: dict, sleep: float = 0.1):
     time.sleep(sleep)
@@ -115,5 +117,9 @@ def solve_part1():
     )
 
 
+def run(target_row: int = 2981, target_column: int = 3075) -> Result:
+    return measure(lambda: compute_code(target_row, target_column))
+
+
 if __name__ == "__main__":
     solve_part1()
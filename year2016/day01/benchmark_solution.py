@@ -0,0 +1,18 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_trace_path_to_hq(benchmark):
+    instructions = Path(INPUT_PATH).read_text()
+    benchmark(solution.trace_path_to_hq, instructions)
+
+
+def test_find_first_recurring_location(benchmark):
+    instructions = Path(INPUT_PATH).read_text()
+    benchmark(
+        lambda: solution.find_first_recurring_location(
+            solution.trace_path_to_hq(instructions)
+        )
+    )
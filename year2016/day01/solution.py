@@ -49,6 +49,8 @@ How many blocks away is the first location you visit twice?
 from pathlib import Path
 from typing import Final
 
+from aoc.result import Result, measure
+
 
 FACING_DIRECTIONS: Final[dict[str, dict[str, str]]] = {
     "L": {"N": "W", "E": "N", "S": "E", "W": "S"},
@@ -116,6 +118,19 @@ def solve_part2(input_path: str):
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda: compute_manhattan_distance_from_origin(
+            trace_path_to_hq(Path(input_path).read_text())[-1]
+        ),
+        lambda: compute_manhattan_distance_from_origin(
+            find_first_recurring_location(
+                trace_path_to_hq(Path(input_path).read_text())
+            )
+        ),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
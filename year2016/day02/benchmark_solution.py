@@ -0,0 +1,11 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_find_bathroom_code(benchmark):
+    instructions = solution.parse_input(INPUT_PATH)
+    benchmark(
+        solution.find_bathroom_code, instructions, solution.KEYPAD_PART2, 1, 3
+    )
@@ -82,6 +82,8 @@ Using the same instructions in your puzzle input, what is the correct bathroom c
 from pathlib import Path
 from typing import Final
 
+from aoc.result import Result, measure
+
 
 KEYPAD_PART1: Final[list[list[str]]] = [
     ["", "", "", "", ""],
@@ -150,6 +152,14 @@ def solve_part2(input_path: str):
     print(f"Part 2:\nThe bathroom code is {bathroom_code}!\n")
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda instructions: find_bathroom_code(instructions, KEYPAD_PART1, 1, 1),
+        lambda instructions: find_bathroom_code(instructions, KEYPAD_PART2, 1, 3),
+        setup=lambda: parse_input(input_path),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
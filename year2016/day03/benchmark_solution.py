@@ -0,0 +1,10 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_filter_valid_triangles(benchmark):
+    benchmark(
+        lambda: solution.filter_valid_triangles(solution.parse_input_part2(INPUT_PATH))
+    )
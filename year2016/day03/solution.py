@@ -45,27 +45,26 @@ from pathlib import Path
 from typing import Generator
 from itertools import combinations, batched
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 def parse_input_part1(input_path: str) -> Generator[tuple[int, int, int], None, None]:
-    with Path(input_path).open() as input_file:
-        for triangle_specification in input_file:
-            yield tuple(
-                int(i) for i in triangle_specification.split()
-            )  # type: ignore[misc]
+    for triangle_specification in iter_lines(input_path):
+        yield tuple(int(i) for i in triangle_specification.split())  # type: ignore[misc]
 
     return None
 
 
 def parse_input_part2(input_path: str) -> Generator[tuple[int, int, int], None, None]:
-    with Path(input_path).open() as input_file:
-        for triangle_specification_triple in batched(input_file, 3):
-            for triangle_specification in zip(  # transpose with zip
-                *(
-                    tuple(int(i) for i in line.split())
-                    for line in triangle_specification_triple
-                )
-            ):
-                yield triangle_specification  # type: ignore[misc]
+    for triangle_specification_triple in batched(iter_lines(input_path), 3):
+        for triangle_specification in zip(  # transpose with zip
+            *(
+                tuple(int(i) for i in line.split())
+                for line in triangle_specification_triple
+            )
+        ):
+            yield triangle_specification  # type: ignore[misc]
 
     return None
 
@@ -104,6 +103,13 @@ def solve_part2(input_path: str):
     print(f"Part 2:\n{len(valid_triangles)} of the listed triangles are valid.\n")
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda: len(filter_valid_triangles(parse_input_part1(input_path))),
+        lambda: len(filter_valid_triangles(parse_input_part2(input_path))),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
@@ -0,0 +1,19 @@
+from pathlib import Path
+from . import solution
+from aoc.generators import write_input
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_filter_real_rooms(benchmark):
+    benchmark(
+        lambda: solution.sum_real_room_sector_ids(solution.parse_input(INPUT_PATH))
+    )
+
+
+def test_filter_real_rooms_large_input(benchmark, tmp_path):
+    input_path = str(write_input(tmp_path / "input.txt", 2016, 4, 10**5))
+    benchmark(
+        lambda: solution.sum_real_room_sector_ids(solution.parse_input(input_path)),
+        rounds=1,
+    )
@@ -49,16 +49,18 @@ from pathlib import Path
 from typing import Generator, Iterable
 from collections import Counter
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> Generator[tuple[str, str, str], None, None]:
-    with Path(input_path).open() as input_file:
-        for line in input_file:
-            line = line.strip()
-            name = line[:-11]
-            sector_id = line[-10:-7]
-            checksum = line[-6:-1]
+    for line in iter_lines(input_path):
+        line = line.strip()
+        name = line[:-11]
+        sector_id = line[-10:-7]
+        checksum = line[-6:-1]
 
-            yield (name, sector_id, checksum)
+        yield (name, sector_id, checksum)
 
     return None
 
@@ -104,15 +106,26 @@ def solve_part1(input_path: str):
     print(f"Part 1:\nThe sum of the sector IDs of the real rooms is {sector_id_sum}.\n")
 
 
-def solve_part2(input_path: str):
-    for name, sector_id, _ in decrypt_room_names(
-        filter_real_rooms(parse_input(input_path))
-    ):
+def find_north_pole_sector_id(room_encryptions: Iterable[tuple[str, str, str]]) -> str:
+    for name, sector_id, _ in decrypt_room_names(filter_real_rooms(room_encryptions)):
         if "north" in name:
-            print(
-                f"Part 2:\nThe sector ID of the room where North Pole objects are stored is {sector_id}.\n"
-            )
-            break
+            return sector_id
+
+    return ""
+
+
+def solve_part2(input_path: str):
+    sector_id = find_north_pole_sector_id(parse_input(input_path))
+    print(
+        f"Part 2:\nThe sector ID of the room where North Pole objects are stored is {sector_id}.\n"
+    )
+
+
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda: sum_real_room_sector_ids(parse_input(input_path)),
+        lambda: find_north_pole_sector_id(parse_input(input_path)),
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,5 @@
+from . import solution
+
+
+def test_find_password_part1(benchmark):
+    benchmark(solution.find_password_part1, "ugkcyxxp", rounds=1)
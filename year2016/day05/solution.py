@@ -59,46 +59,67 @@ Be extra proud of your solution if it uses a cinematic "decrypting" animation.
 --- Notes ---
 
 """
-import hashlib
+from itertools import islice
 
+from aoc.md5 import mine
+from aoc.result import Result, measure
 
-def find_password_part1(door_id: str) -> str:
-    password: str = ""
-    index: int = 0
-    while len(password) < 8:
-        hash: str = hashlib.md5(f"{door_id}{index}".encode()).hexdigest()
-        if hash.startswith("00000"):
-            password += hash[5]
-        index += 1
 
-    return password
+def find_password_part1(door_id: str) -> str:
+    return "".join(hash[5] for _, hash in islice(mine(door_id, 5), 8))
 
 
 def find_password_part2(door_id: str) -> str:
     password: str = "########"
-    index: int = 0
-    while "#" in password:
-        hash: str = hashlib.md5(f"{door_id}{index}".encode()).hexdigest()
-        if hash.startswith("00000"):
-            try:
-                position: int = int(hash[5])
-                if position < 8 and password[position] == "#":
-                    password = password[:position] + hash[6] + password[position + 1 :]
-            except ValueError:
-                pass
-        index += 1
+    hashes = mine(door_id, 5)
+    for _, hash in hashes:
+        try:
+            position: int = int(hash[5])
+            if position < 8 and password[position] == "#":
+                password = password[:position] + hash[6] + password[position + 1 :]
+        except ValueError:
+            pass
+        if "#" not in password:
+            break
+    hashes.close()
 
     return password
 
 
-def solve_part1():
-    print(f"Part 1:\nThe password is {find_password_part1('ugkcyxxp')}\n")
+def find_passwords(door_id: str) -> tuple[str, str]:
+    """Both passwords from a single search, the hashes are mined only once."""
 
+    password_part1: str = ""
+    password_part2: str = "########"
+    hashes = mine(door_id, 5)
+    for _, hash in hashes:
+        if len(password_part1) < 8:
+            password_part1 += hash[5]
+        try:
+            position: int = int(hash[5])
+            if position < 8 and password_part2[position] == "#":
+                password_part2 = (
+                    password_part2[:position] + hash[6] + password_part2[position + 1 :]
+                )
+        except ValueError:
+            pass
+        if len(password_part1) == 8 and "#" not in password_part2:
+            break
+    hashes.close()
 
-def solve_part2():
-    print(f"Part 2:\nThe password is {find_password_part2('ugkcyxxp')}\n")
+    return password_part1, password_part2
+
+
+def run(door_id: str = "ugkcyxxp") -> Result:
+    return measure(
+        lambda passwords: passwords[0],
+        lambda passwords: passwords[1],
+        setup=lambda: find_passwords(door_id),
+    )
 
 
 if __name__ == "__main__":
-    solve_part1()
-    solve_part2()
+    password_part1, password_part2 = find_passwords("ugkcyxxp")
+
+    print(f"Part 1:\nThe password is {password_part1}\n")
+    print(f"Part 2:\nThe password is {password_part2}\n")
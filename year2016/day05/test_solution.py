@@ -7,3 +7,7 @@ def test_find_password_part1():
 
 def test_find_password_part2():
     assert solution.find_password_part2("abc") == "05ace8e3"
+
+
+def test_find_passwords():
+    assert solution.find_passwords("abc") == ("18f47a30", "05ace8e3")
@@ -0,0 +1,19 @@
+from pathlib import Path
+from . import solution
+from aoc.generators import write_input
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_recover_message(benchmark):
+    benchmark(
+        lambda: solution.recover_message(solution.parse_input(INPUT_PATH), 8, max)
+    )
+
+
+def test_recover_message_large_input(benchmark, tmp_path):
+    input_path = str(write_input(tmp_path / "input.txt", 2016, 6, 10**5))
+    benchmark(
+        lambda: solution.recover_message(solution.parse_input(input_path), 8, max),
+        rounds=1,
+    )
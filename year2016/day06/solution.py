@@ -59,11 +59,13 @@ from pathlib import Path
 from typing import Generator, Callable
 from collections import defaultdict
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> Generator[str, None, None]:
-    with Path(input_path).open() as input_file:
-        for line in input_file:
-            yield line.strip()
+    for line in iter_lines(input_path):
+        yield line.strip()
 
     return None
 
@@ -97,6 +99,13 @@ def solve_part2(input_path: str):
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda: recover_message(parse_input(input_path), 8, max),
+        lambda: recover_message(parse_input(input_path), 8, min),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
@@ -0,0 +1,12 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_count_ips_supporting_tls(benchmark):
+    benchmark(solution.count_ips_supporting_tls, INPUT_PATH)
+
+
+def test_count_ips_supporting_ssl(benchmark):
+    benchmark(solution.count_ips_supporting_ssl, INPUT_PATH)
@@ -45,11 +45,13 @@ from pathlib import Path
 from typing import Generator
 import re
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> Generator[str, None, None]:
-    with Path(input_path).open() as file:
-        for ip in file:
-            yield ip.strip()
+    for ip in iter_lines(input_path):
+        yield ip.strip()
 
     return None
 
@@ -135,6 +137,13 @@ def solve_part2(input_path: str):
     print(f"Part 2:\n{count_ips_supporting_ssl(input_path)} IPs support SSL.\n")
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda: count_ips_supporting_tls(input_path),
+        lambda: count_ips_supporting_ssl(input_path),
+    )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")
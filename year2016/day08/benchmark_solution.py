@@ -0,0 +1,8 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_run_operations(benchmark):
+    benchmark(lambda: solution.run_operations(solution.parse_input(INPUT_PATH)))
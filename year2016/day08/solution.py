@@ -74,11 +74,13 @@ After you swipe your card, what code is the screen trying to display?
 from pathlib import Path
 from typing import Generator
 
+from aoc.inputs import iter_lines
+from aoc.result import Result, measure
+
 
 def parse_input(input_path: str) -> Generator[str, None, None]:
-    with Path(input_path).open() as file:
-        for operation in file:
-            yield operation.strip()
+    for operation in iter_lines(input_path):
+        yield operation.strip()
 
     return None
 
@@ -130,6 +132,10 @@ def run_operations(operations: Generator[str, None, None]) -> list[list[bool]]:
     return screen
 
 
+def render_screen(screen: list[list[bool]]) -> str:
+    return "\n".join("".join("#" if pixel else "." for pixel in row) for row in screen)
+
+
 def solve(input_path: str):
     final_screen = run_operations(parse_input(input_path))
     print(
@@ -137,8 +143,15 @@ def solve(input_path: str):
     )
 
     print("Part 2:\nThe screen displays:")
-    for row in final_screen:
-        print("".join("#" if pixel else "." for pixel in row))
+    print(render_screen(final_screen))
+
+
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    return measure(
+        lambda screen: sum(sum(row) for row in screen),
+        render_screen,
+        setup=lambda: run_operations(parse_input(input_path)),
+    )
 
 
 if __name__ == "__main__":
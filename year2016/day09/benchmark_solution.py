@@ -0,0 +1,11 @@
+from pathlib import Path
+from . import solution
+
+INPUT_PATH = f"{Path(__file__).parent}/input.txt"
+
+
+def test_get_length_decompressed_sequence_part2(benchmark):
+    compressed_sequence = Path(INPUT_PATH).read_text()
+    benchmark(
+        solution.get_length_decompressed_sequence_part2, compressed_sequence
+    )
@@ -53,6 +53,9 @@ from pathlib import Path
 from dataclasses import dataclass
 import re
 
+from aoc.inputs import Data, as_bytes, view_input
+from aoc.result import Result, measure
+
 
 @dataclass
 class Marker:
@@ -65,9 +68,10 @@ class Marker:
         self.length = self.end - self.start
 
 
-def get_markers(compressed_sequence: str) -> list[Marker]:
+def get_markers(compressed_sequence: Data) -> list[Marker]:
     markers = []
-    marker_pattern = re.compile(r"\((\d+)x(\d+)\)")
+    marker_pattern = re.compile(rb"\((\d+)x(\d+)\)")
+    compressed_sequence = as_bytes(compressed_sequence)
 
     match = marker_pattern.search(compressed_sequence)
     while match is not None:
@@ -88,7 +92,7 @@ def get_length_decompressed_marker(marker: Marker) -> int:
     return marker.n_chars * marker.n_reps - marker.n_chars - marker.length
 
 
-def get_length_decompressed_sequence_part1(compressed_sequence: str) -> int:
+def get_length_decompressed_sequence_part1(compressed_sequence: Data) -> int:
     markers = get_markers(compressed_sequence)
 
     return sum(get_length_decompressed_marker(marker) for marker in markers) + len(
@@ -96,7 +100,8 @@ def get_length_decompressed_sequence_part1(compressed_sequence: str) -> int:
     )
 
 
-def get_length_decompressed_sequence_part2(compressed_sequence: str) -> int:
+def get_length_decompressed_sequence_part2(compressed_sequence: Data) -> int:
+    compressed_sequence = as_bytes(compressed_sequence)  # slices without copying
     length_decompressed_sequence = len(compressed_sequence)
 
     for marker in get_markers(compressed_sequence):
@@ -112,25 +117,34 @@ def get_length_decompressed_sequence_part2(compressed_sequence: str) -> int:
 
 
 def solve_part1(input_path: str):
-    compressed_sequence = Path(input_path).read_text()
-    length_decompressed_sequence = get_length_decompressed_sequence_part1(
-        compressed_sequence
-    )
+    with view_input(input_path) as compressed_sequence:
+        length_decompressed_sequence = get_length_decompressed_sequence_part1(
+            compressed_sequence
+        )
     print(
         f"Part 1:\nThe length of the decompressed sequence is {length_decompressed_sequence}\n"
     )
 
 
 def solve_part2(input_path: str):
-    compressed_sequence = Path(input_path).read_text()
-    length_decompressed_sequence = get_length_decompressed_sequence_part2(
-        compressed_sequence
-    )
+    with view_input(input_path) as compressed_sequence:
+        length_decompressed_sequence = get_length_decompressed_sequence_part2(
+            compressed_sequence
+        )
     print(
         f"Part 2:\nThe length of the decompressed sequence is {length_decompressed_sequence}\n"
     )
 
 
+def run(input_path: str = f"{Path(__file__).parent}/input.txt") -> Result:
+    with view_input(input_path) as compressed_sequence:
+        return measure(
+            get_length_decompressed_sequence_part1,
+            get_length_decompressed_sequence_part2,
+            setup=lambda: compressed_sequence,
+        )
+
+
 if __name__ == "__main__":
     solve_part1(f"{Path(__file__).parent}/input.txt")
     solve_part2(f"{Path(__file__).parent}/input.txt")